@@ -0,0 +1,106 @@
+"""Coalescing of concurrent single-item requests into batches."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Mapping, Sequence
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class AsyncBatcher(ABC, Generic[K, V]):
+    """Collect items requested within a short window and process them together.
+
+    Callers await process() for a single item. Items arriving within
+    max_queue_time of the first queued item (or until max_batch_size distinct
+    items are queued) are handed to process_batch() in one call, and each caller
+    receives the result for its own item.
+
+    Subclasses implement process_batch().
+    """
+
+    def __init__(self, max_batch_size: int = 50, max_queue_time: float = 0.005) -> None:
+        """Initialize the batcher.
+
+        Args:
+            max_batch_size: Maximum number of distinct items per batch
+            max_queue_time: Seconds to wait for more items before processing a batch
+        """
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: dict[K, list[asyncio.Future[V]]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @abstractmethod
+    async def process_batch(self, items: Sequence[K]) -> Mapping[K, V | Exception]:
+        """Process a batch of items.
+
+        Args:
+            items: The distinct items of the batch
+
+        Returns:
+            Mapping from item to its result, or to the exception to raise for it.
+            Items missing from the mapping raise a KeyError.
+        """
+
+    async def process(self, item: K) -> V:
+        """Queue an item and wait for its result.
+
+        Args:
+            item: The item to process
+
+        Returns:
+            The result for the item
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[V] = loop.create_future()
+        self._pending.setdefault(item, []).append(future)
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_queue_time, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(lambda _: self._cancel_waiting(batch))
+
+    async def _run(self, batch: dict[K, list[asyncio.Future[V]]]) -> None:
+        try:
+            results = await self.process_batch(list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for item, futures in batch.items():
+            result = results.get(item, KeyError(item))
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    @staticmethod
+    def _cancel_waiting(batch: dict[K, list[asyncio.Future[V]]]) -> None:
+        # Don't leave callers waiting if the batch task was cancelled
+        for futures in batch.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
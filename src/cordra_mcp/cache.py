@@ -0,0 +1,246 @@
+"""In-process caching for Cordra lookups."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Generic, Protocol, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Loader = Callable[[T | None], Awaitable[T]]
+
+
+@dataclass
+class CacheEntry(Generic[T]):
+    """A cached value together with the time it was stored."""
+
+    value: T
+    stored_at: float
+
+
+class CacheBackend(Protocol[T]):
+    """Storage used by the cache.
+
+    The default backend keeps entries in process memory. Deployments running
+    several workers can provide a shared store (e.g. Redis) with the same
+    interface without touching any call sites.
+    """
+
+    async def get(self, key: str) -> CacheEntry[T] | None:
+        """Return the entry stored under key, if any."""
+        ...
+
+    async def set(self, key: str, entry: CacheEntry[T]) -> None:
+        """Store an entry under key."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove the entry stored under key, if any."""
+        ...
+
+
+class InMemoryCacheBackend(Generic[T]):
+    """Cache backend storing entries in a process-local dictionary.
+
+    If max_entries is set, the least recently used entries are evicted once
+    the limit is exceeded.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry[T]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> CacheEntry[T] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry[T]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+
+@dataclass
+class _Call(Generic[T]):
+    """A call in flight together with the number of callers awaiting it."""
+
+    task: asyncio.Task[T]
+    waiters: int = 0
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls for the same key into a single call.
+
+    The first caller for a key starts the coroutine in a separate task, every
+    caller arriving while it is still in flight awaits the same result (or
+    exception). A cancelled caller does not affect the others, the call itself
+    is only cancelled once no caller is waiting for it anymore.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, _Call[T]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn for key unless a call for the same key is already in flight.
+
+        Args:
+            key: Key identifying identical calls
+            fn: Coroutine factory performing the actual call
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        call = self._inflight.get(key)
+        if call is None:
+            call = self._start(key, fn)
+
+        call.waiters += 1
+        try:
+            # Shield the shared task so a cancelled caller does not cancel it
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                self._forget(key, call)
+                call.task.cancel()
+
+    def _start(self, key: str, fn: Callable[[], Awaitable[T]]) -> _Call[T]:
+        async def run() -> T:
+            return await fn()
+
+        call = _Call(task=asyncio.create_task(run()))
+        self._inflight[key] = call
+        call.task.add_done_callback(lambda _: self._forget(key, call))
+        return call
+
+    def _forget(self, key: str, call: _Call[T]) -> None:
+        if self._inflight.get(key) is call:
+            del self._inflight[key]
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """Async TTL cache with stale-while-revalidate semantics.
+
+    Entries younger than ``ttl`` are served directly. Entries that are older
+    but still within the additional ``stale_ttl`` window are served as well,
+    while a background task refreshes them. If that refresh fails, the stale
+    entry stays in place, unless the loader raised one of the ``evict_on``
+    exceptions, which signal that the value no longer exists upstream and
+    remove the entry. Older entries are treated as misses.
+
+    Lookups are counted in ``stats`` as fresh hits, stale hits and misses.
+
+    Concurrent loads for the same key are coalesced, so only one of them calls
+    the loader and the others share its result. The loader receives the value
+    currently cached for the key (or None), which lets it revalidate that value
+    upstream instead of downloading it again.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        backend: CacheBackend[T] | None = None,
+        evict_on: tuple[type[Exception], ...] = (),
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is considered fresh. Values <= 0 disable caching.
+            stale_ttl: Seconds after expiry during which a stale entry is still
+                served while it is refreshed in the background
+            backend: Storage for the entries, defaults to process memory
+            evict_on: Exception types raised by the loader that remove the
+                cached entry instead of keeping it as a stale fallback
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.evict_on = evict_on
+        self._backend: CacheBackend[T] = (
+            backend if backend is not None else InMemoryCacheBackend()
+        )
+        self._flight: SingleFlight[T] = SingleFlight()
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0}
+
+    async def get(self, key: str, loader: Loader[T]) -> T:
+        """Return the value for key, calling loader on a miss.
+
+        Args:
+            key: The cache key
+            loader: Coroutine function fetching the value from upstream, called
+                with the previously cached value or None
+
+        Returns:
+            The cached or freshly loaded value
+
+        Raises:
+            Any exception raised by loader on a miss
+        """
+        if self.ttl <= 0:
+            return await self._flight.do(key, lambda: loader(None))
+
+        entry = await self._backend.get(key)
+        previous = None
+        if entry is not None:
+            age = time.time() - entry.stored_at
+            if age < self.ttl:
+                self.stats["hits"] += 1
+                return entry.value
+            if age < self.ttl + self.stale_ttl:
+                self.stats["stale_hits"] += 1
+                self._schedule_refresh(key, loader, entry.value)
+                return entry.value
+            previous = entry.value
+
+        self.stats["misses"] += 1
+        return await self._flight.do(key, lambda: self._load(key, loader, previous))
+
+    async def set(self, key: str, value: T) -> None:
+        """Store a value that was loaded elsewhere, e.g. by a bulk request.
+
+        Args:
+            key: The cache key
+            value: The value to store
+        """
+        if self.ttl > 0:
+            await self._backend.set(key, CacheEntry(value=value, stored_at=time.time()))
+
+    async def _load(self, key: str, loader: Loader[T], previous: T | None) -> T:
+        try:
+            value = await loader(previous)
+        except self.evict_on:
+            await self._backend.delete(key)
+            raise
+        await self._backend.set(key, CacheEntry(value=value, stored_at=time.time()))
+        return value
+
+    def _schedule_refresh(self, key: str, loader: Loader[T], previous: T) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, loader, previous))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, key: str, loader: Loader[T], previous: T) -> None:
+        try:
+            await self._flight.do(key, lambda: self._load(key, loader, previous))
+        except self.evict_on as e:
+            logger.info("Background refresh of '%s' removed the entry: %s", key, e)
+        except Exception as e:
+            logger.warning("Background refresh of '%s' failed, serving stale: %s", key, e)
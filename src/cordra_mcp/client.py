@@ -1,18 +1,36 @@
-"""Cordra client wrapper using HTTP requests."""
+"""Cordra client wrapper using asynchronous HTTP requests."""
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Mapping, Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
-import requests
-from pydantic import BaseModel, Field
-
+import httpx
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from .batch import AsyncBatcher
+from .cache import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    SingleFlight,
+    StaleWhileRevalidateCache,
+)
 from .config import CordraConfig
 
 logger = logging.getLogger(__name__)
 
 
 class DigitalObject(BaseModel):
-    """Model for a Cordra digital object."""
+    """Model for a Cordra digital object.
+
+    Instances are frozen because cached objects are shared between callers.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     id: str = Field(description="Object identifier")
     type: str = Field(description="Object type")
@@ -24,6 +42,22 @@ class DigitalObject(BaseModel):
     )
 
 
+# Built once and reused for every validated object
+_DIGITAL_OBJECT_ADAPTER = TypeAdapter(DigitalObject)
+
+
+@dataclass(frozen=True)
+class CachedObject:
+    """A cached digital object together with the validators of its response.
+
+    The validators (ETag / Last-Modified) belong to this exact copy, so a 304
+    Not Modified can only ever confirm the copy that was revalidated.
+    """
+
+    obj: DigitalObject
+    validators: dict[str, str] = field(default_factory=dict)
+
+
 class CordraClientError(Exception):
     """Base exception for Cordra client errors."""
 
@@ -42,28 +76,135 @@ class CordraAuthenticationError(CordraClientError):
     pass
 
 
+class ObjectFetchBatcher(AsyncBatcher[str, CachedObject]):
+    """Fetch objects requested concurrently with a single search request.
+
+    A batch of IDs is resolved with one id:(...) query. IDs the search does not
+    return, or all IDs if the search fails, are fetched individually so callers
+    still get the regular not-found and authentication errors.
+    """
+
+    def __init__(
+        self,
+        client: "CordraClient",
+        max_batch_size: int = 50,
+        max_queue_time: float = 0.005,
+    ) -> None:
+        super().__init__(max_batch_size=max_batch_size, max_queue_time=max_queue_time)
+        self.cordra_client = client
+
+    async def process_batch(
+        self, items: Sequence[str]
+    ) -> Mapping[str, CachedObject | Exception]:
+        results: dict[str, CachedObject | Exception] = {}
+        if len(items) > 1:
+            quoted = " OR ".join(
+                '"' + item.replace("\\", "\\\\").replace('"', '\\"') + '"'
+                for item in items
+            )
+            query = f"id:({quoted})"
+            params = {
+                "query": query,
+                "pageSize": str(len(items)),
+                "pageNum": "0",
+                "full": "true",
+            }
+            try:
+                search_result = await self.cordra_client._search(params, query)
+                for cordra_obj in search_result["results"]:
+                    if cordra_obj.get("id") in items:
+                        # Search results carry no validators for the object
+                        results[cordra_obj["id"]] = CachedObject(
+                            self.cordra_client._build_object(
+                                cordra_obj["id"], cordra_obj
+                            )
+                        )
+            except CordraClientError as e:
+                logger.debug("Batched fetch failed, fetching individually: %s", e)
+
+        missing = [item for item in items if item not in results]
+        fetched = await asyncio.gather(
+            *(self.cordra_client._fetch_object(item) for item in missing),
+            return_exceptions=True,
+        )
+        for item, obj in zip(missing, fetched, strict=True):
+            if isinstance(obj, BaseException) and not isinstance(obj, Exception):
+                raise obj
+            results[item] = obj
+        return results
+
+
 class CordraClient:
-    """Client for interacting with Cordra repository using HTTP requests."""
+    """Client for interacting with Cordra repository using asynchronous HTTP requests."""
 
-    def __init__(self, config: CordraConfig) -> None:
+    def __init__(
+        self,
+        config: CordraConfig,
+        cache_backend: CacheBackend[CachedObject] | None = None,
+    ) -> None:
         """Initialize the Cordra client.
 
         Args:
             config: Configuration settings for the Cordra connection
+            cache_backend: Optional storage for cached objects and schemas,
+                defaults to process memory bounded by cache_max_entries
         """
         self.config = config
-        self.session = requests.Session()
-        self.session.verify = config.verify_ssl
+        if cache_backend is None:
+            cache_backend = InMemoryCacheBackend(max_entries=config.cache_max_entries)
+        self._cache = StaleWhileRevalidateCache(
+            ttl=config.cache_ttl,
+            stale_ttl=config.stale_ttl,
+            backend=cache_backend,
+            # Deleted objects must not be served from the stale window
+            evict_on=(CordraNotFoundError,),
+        )
+        self._search_flight: SingleFlight[dict[str, Any]] = SingleFlight()
+        # Expiry time of remembered 404s per object ID
+        self._not_found: OrderedDict[str, float] = OrderedDict()
+        self._batcher: ObjectFetchBatcher | None = None
+        if config.batch_window > 0:
+            self._batcher = ObjectFetchBatcher(
+                self, max_batch_size=50, max_queue_time=config.batch_window
+            )
 
         # Set up authentication
+        self._auth: tuple[str, str] | None = None
         if config.username and config.password:
-            self.session.auth = (config.username, config.password)
+            self._auth = (config.username, config.password)
         elif config.username or config.password:
             logger.warning(
                 "Only username or password provided, not both. Authentication may fail."
             )
 
-    def _handle_http_error(self, response: requests.Response, context: str) -> None:
+        # Created on first use, inside the event loop that serves the requests
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client, created on first access.
+
+        A single client is shared by all requests so concurrent requests reuse
+        keep-alive connections.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.config.base_url,
+                auth=self._auth,
+                verify=self.config.verify_ssl,
+                timeout=self.config.timeout,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool, if it was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _handle_http_error(self, response: httpx.Response, context: str) -> None:
         """Handle HTTP errors and raise appropriate exceptions.
 
         Args:
@@ -87,9 +228,41 @@ class CordraClient:
         else:
             raise CordraClientError(f"{context}: HTTP error {status_code}")
 
+    def _build_object(
+        self, object_id: str, cordra_obj: dict[str, Any], default_type: str = ""
+    ) -> DigitalObject:
+        """Build a DigitalObject from a Cordra JSON response.
+
+        Responses from a trusted Cordra instance are wrapped without running the
+        pydantic validators, since they are only serialized again afterwards.
+        Set trust_upstream to False to validate them.
+
+        Args:
+            object_id: The identifier to assign to the object
+            cordra_obj: The parsed JSON response from Cordra
+            default_type: Type to use if the response does not contain one
+
+        Returns:
+            The digital object
+        """
+        fields: dict[str, Any] = {
+            "id": object_id,
+            "type": cordra_obj.get("type", default_type),
+            "content": cordra_obj.get("content", cordra_obj),
+            "metadata": cordra_obj.get("metadata"),
+            "acl": cordra_obj.get("acl"),
+            "payloads": cordra_obj.get("payloads"),
+        }
+        if self.config.trust_upstream:
+            return DigitalObject.model_construct(**fields)
+        return _DIGITAL_OBJECT_ADAPTER.validate_python(fields)
+
     async def get_object(self, object_id: str) -> DigitalObject:
         """Retrieve a digital object by its ID.
 
+        Results are cached according to the cache_ttl and stale_ttl settings.
+        IDs that were not found are remembered for not_found_ttl seconds.
+
         Args:
             object_id: The unique identifier of the object to retrieve
 
@@ -102,34 +275,111 @@ class CordraClient:
             CordraAuthenticationError: If authentication fails
             CordraClientError: For other API errors
         """
-        url = f"{self.config.base_url}/objects/{object_id}"
+        expires_at = self._not_found.get(object_id)
+        if expires_at is not None:
+            if time.monotonic() < expires_at:
+                raise CordraNotFoundError(
+                    f"Failed to retrieve object {object_id}: Resource not found"
+                )
+            del self._not_found[object_id]
+
+        cached = await self._cache.get(
+            f"object:{object_id}",
+            lambda cached: self._load_object(object_id, cached),
+        )
+        return cached.obj
+
+    def _remember_not_found(self, object_id: str) -> None:
+        """Remember that an object does not exist, bounded like the cache."""
+        if self.config.not_found_ttl <= 0:
+            return
+        self._not_found[object_id] = time.monotonic() + self.config.not_found_ttl
+        self._not_found.move_to_end(object_id)
+        while len(self._not_found) > self.config.cache_max_entries:
+            self._not_found.popitem(last=False)
+
+    async def _load_object(
+        self, object_id: str, cached: CachedObject | None = None
+    ) -> CachedObject:
+        """Load an object from Cordra, batching concurrent loads if enabled.
+
+        Cached objects with known validators are revalidated individually, since
+        a batched search cannot be answered with 304 Not Modified. Objects that
+        are not found, also during a background refresh, are remembered in the
+        negative cache.
+        """
+        try:
+            if cached is not None and cached.validators:
+                return await self._fetch_object(object_id, cached)
+            if self._batcher is not None:
+                return await self._batcher.process(object_id)
+            return await self._fetch_object(object_id)
+        except CordraNotFoundError:
+            self._remember_not_found(object_id)
+            raise
+
+    async def _fetch_object(
+        self, object_id: str, cached: CachedObject | None = None
+    ) -> CachedObject:
+        """Fetch a digital object from Cordra, bypassing the cache.
+
+        If a previously fetched copy is passed and Cordra sent an ETag or
+        Last-Modified header for it, the request is made conditional and the
+        cached copy is returned unchanged on 304 Not Modified.
+        """
+        url = f"/objects/{object_id}"
         params = {"full": "true"}
 
         try:
-            response = self.session.get(url, params=params, timeout=self.config.timeout)
+            if cached is not None and cached.validators:
+                response = await self.client.get(
+                    url,
+                    params=params,
+                    headers=self._conditional_headers(cached.validators),
+                )
+                if response.status_code == 304:
+                    return cached
+            else:
+                response = await self.client.get(url, params=params)
 
-            if not response.ok:
+            if not response.is_success:
                 self._handle_http_error(
                     response, f"Failed to retrieve object {object_id}"
                 )
 
-            cordra_obj = response.json()
+            cordra_obj = orjson.loads(response.content)
+            validators = {
+                name: response.headers[name]
+                for name in ("ETag", "Last-Modified")
+                if name in response.headers
+            }
 
-            return DigitalObject(
-                id=object_id,
-                type=cordra_obj.get("type", ""),
-                content=cordra_obj.get("content", cordra_obj),
-                metadata=cordra_obj.get("metadata"),
-                acl=cordra_obj.get("acl"),
-                payloads=cordra_obj.get("payloads"),
-            )
+            return CachedObject(self._build_object(object_id, cordra_obj), validators)
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             raise CordraClientError(
                 f"Failed to retrieve object {object_id}: {e}"
             ) from e
 
-    async def find(self, query: str, object_type: str | None = None, page_size: int = 20, page_num: int = 0) -> dict[str, Any]:
+    @staticmethod
+    def _conditional_headers(validators: dict[str, str]) -> dict[str, str]:
+        """Build the conditional request headers for stored validators.
+
+        If-Modified-Since is only used when Cordra did not send an ETag.
+        """
+        if "ETag" in validators:
+            return {"If-None-Match": validators["ETag"]}
+        return {"If-Modified-Since": validators["Last-Modified"]}
+
+    async def find(
+        self,
+        query: str,
+        object_type: str | None = None,
+        page_size: int = 20,
+        page_num: int = 0,
+        fields: Sequence[str] | None = None,
+        full: bool = False,
+    ) -> dict[str, Any]:
         """Find objects using a Cordra query with pagination support.
 
         Args:
@@ -137,6 +387,9 @@ class CordraClient:
             object_type: Optional filter by object type
             page_size: Number of results per page (if None, no limit)
             page_num: Page number to retrieve (0-based, default: 0)
+            fields: Optional JSON pointers (e.g. "/content/name") restricting
+                the returned objects to these parts
+            full: Whether to return complete objects including metadata
 
         Returns:
             Dict containing:
@@ -155,22 +408,82 @@ class CordraClient:
         if object_type:
             final_query = f"type:{object_type} AND ({query})"
 
-        url = f"{self.config.base_url}/search"
         params = {
             "query": final_query,
             "pageSize": str(page_size),
             "pageNum": str(page_num),
         }
+        if fields:
+            params["filter"] = orjson.dumps(list(fields)).decode()
+        if full:
+            params["full"] = "true"
+
+        # Identical searches running concurrently share one upstream request.
+        # Each caller gets its own copy of the result dict.
+        search_result = await self._search_flight.do(
+            "&".join(f"{name}={value}" for name, value in params.items()),
+            lambda: self._search(params, final_query),
+        )
+        return dict(search_result)
+
+    async def find_iter(
+        self,
+        query: str,
+        object_type: str | None = None,
+        page_size: int = 500,
+        fields: Sequence[str] | None = None,
+        full: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over all objects matching a query, fetching one page at a time.
+
+        Args:
+            query: The query string to search for objects
+            object_type: Optional filter by object type
+            page_size: Number of results requested per page
+            fields: Optional JSON pointers restricting the returned objects
+            full: Whether to return complete objects including metadata
+
+        Yields:
+            Objects matching the query as dictionaries
+
+        Raises:
+            CordraAuthenticationError: If authentication fails
+            CordraClientError: For other API errors
+        """
+        page_num = 0
+        while True:
+            search_result = await self.find(
+                query,
+                object_type=object_type,
+                page_size=page_size,
+                page_num=page_num,
+                fields=fields,
+                full=full,
+            )
+            results = search_result["results"]
+            for result in results:
+                yield result
+
+            # A short page is the last one
+            if len(results) < page_size:
+                return
+            page_num += 1
+
+    async def _search(
+        self, params: dict[str, str], final_query: str
+    ) -> dict[str, Any]:
+        """Run a search request against Cordra."""
+        url = "/search"
 
         try:
-            response = self.session.get(url, params=params, timeout=self.config.timeout)
+            response = await self.client.get(url, params=params)
 
-            if not response.ok:
+            if not response.is_success:
                 self._handle_http_error(
                     response, f"Failed to search with query '{final_query}'"
                 )
 
-            search_result = response.json()
+            search_result = orjson.loads(response.content)
 
             return {
                 "results": search_result["results"],
@@ -179,7 +492,7 @@ class CordraClient:
                 "page_size": search_result["pageSize"]
             }
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             raise CordraClientError(
                 f"Failed to search with query '{final_query}': {e}"
             ) from e
@@ -187,6 +500,8 @@ class CordraClient:
     async def get_schema(self, schema_name: str) -> DigitalObject:
         """Retrieve a schema definition by its name.
 
+        Results are cached according to the cache_ttl and stale_ttl settings.
+
         Args:
             schema_name: The name of the schema to retrieve
 
@@ -198,6 +513,16 @@ class CordraClient:
             CordraAuthenticationError: If authentication fails
             CordraClientError: For other API errors
         """
+        cached = await self._cache.get(
+            f"schema:{schema_name}",
+            lambda cached: self._fetch_schema(schema_name, cached),
+        )
+        return cached.obj
+
+    async def _fetch_schema(
+        self, schema_name: str, cached: CachedObject | None = None
+    ) -> CachedObject:
+        """Fetch a schema definition from Cordra, bypassing the cache."""
         # Search for the specific schema by name using correct query format
         query = f"type:Schema AND /name:{schema_name}"
 
@@ -205,14 +530,15 @@ class CordraClient:
             search_result = await self.find(query)
             schemas = search_result["results"]
 
-            if not schemas:
-                raise CordraNotFoundError(f"Schema '{schema_name}' not found")
+            if schemas:
+                # Get the first matching schema (should be unique by name)
+                schema_id = schemas[0]["id"]
 
-            # Get the first matching schema (should be unique by name)
-            schema_data = schemas[0]
-
-            # Get the full schema object using its ID
-            return await self.get_object(schema_data["id"])
+                # Get the full schema object using its ID, revalidating the
+                # cached copy if the name still resolves to the same object
+                if cached is not None and cached.obj.id != schema_id:
+                    cached = None
+                return await self._fetch_object(schema_id, cached)
 
         except (CordraNotFoundError, CordraAuthenticationError):
             raise
@@ -221,6 +547,30 @@ class CordraClient:
                 f"Failed to retrieve schema '{schema_name}': {e}"
             ) from e
 
+        # Raised outside the try block so it is not routed through the handlers
+        raise CordraNotFoundError(f"Schema '{schema_name}' not found")
+
+    async def iter_all_schemas(self) -> AsyncIterator[DigitalObject]:
+        """Yield the schema definitions of all types, loaded in bulk.
+
+        The complete schema objects are requested with a few paged searches
+        instead of one lookup per type. Each schema is stored in the schema
+        cache and yielded as soon as its page arrives.
+
+        Yields:
+            The schema objects
+
+        Raises:
+            CordraAuthenticationError: If authentication fails
+            CordraClientError: For other API errors
+        """
+        async for cordra_obj in self.find_iter("type:Schema", full=True):
+            schema = self._build_object(cordra_obj["id"], cordra_obj)
+            schema_name = schema.content.get("name")
+            if schema_name:
+                await self._cache.set(f"schema:{schema_name}", CachedObject(schema))
+            yield schema
+
     async def get_design(self) -> DigitalObject:
         """Retrieve the Cordra design object containing repository configuration.
 
@@ -236,28 +586,23 @@ class CordraClient:
             CordraAuthenticationError: If authentication fails or insufficient privileges
             CordraClientError: For other API errors
         """
-        url = f"{self.config.base_url}/api/objects/design"
+        url = "/api/objects/design"
 
         try:
-            response = self.session.get(url, timeout=self.config.timeout)
+            response = await self.client.get(url)
 
-            if not response.ok:
+            if not response.is_success:
                 self._handle_http_error(
                     response, "Failed to retrieve design object"
                 )
 
-            design_obj = response.json()
+            design_obj = orjson.loads(response.content)
 
-            return DigitalObject(
-                id="design",
-                type=design_obj.get("type", "CordraDesign"),
-                content=design_obj.get("content", design_obj),
-                metadata=design_obj.get("metadata"),
-                acl=design_obj.get("acl"),
-                payloads=design_obj.get("payloads"),
+            return self._build_object(
+                "design", design_obj, default_type="CordraDesign"
             )
 
-        except requests.RequestException as e:
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             raise CordraClientError(
                 f"Failed to retrieve design object: {e}"
             ) from e
@@ -1,6 +1,6 @@
 """Configuration settings for the MCP Cordra server."""
 
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -32,10 +32,51 @@ class CordraConfig(BaseSettings):
         default=True, description="Whether to verify SSL certificates"
     )
     timeout: int = Field(default=30, description="Request timeout in seconds")
+    cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds a cached object or schema is served without refetching (0 disables caching)",
+    )
+    stale_ttl: float = Field(
+        default=300.0,
+        description="Seconds after cache_ttl during which a stale entry is served while it is refreshed",
+    )
+    not_found_ttl: float = Field(
+        default=30.0,
+        description="Seconds an object ID that was not found is answered without asking Cordra (0 disables)",
+    )
+    cache_max_entries: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of objects and schemas kept in the in-memory cache",
+    )
+    schema_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds the serialized schema of a type is reused (0 disables caching)",
+    )
+    schema_list_ttl: float = Field(
+        default=60.0,
+        description="Seconds the list of type names is reused (0 disables caching)",
+    )
+    prewarm_schemas: bool = Field(
+        default=False,
+        description="Load the schemas of all types into the cache in the background at startup",
+    )
+    batch_window: float = Field(
+        default=0.0,
+        description="Seconds to collect concurrent object reads into one search request (0 disables batching)",
+    )
+    trust_upstream: bool = Field(
+        default=True,
+        description="Skip validation of objects returned by Cordra",
+    )
+    pretty_json: bool = Field(
+        default=False,
+        description="Indent JSON responses for easier reading while debugging",
+    )
     run_mode: Literal["stdio", "http"] | None = Field(
         default="stdio", description="Run mode for the MCP client"
     )
-    log_level: str = Field(
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
         validation_alias="LOGLEVEL",
@@ -43,13 +84,6 @@ class CordraConfig(BaseSettings):
 
     @field_validator("log_level", mode="before")
     @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate that log_level is a standard logging level."""
-        level_str = str(v).upper().strip()
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-
-        if level_str not in valid_levels:
-            raise ValueError(
-                f"Invalid log level '{v}'. Must be one of: {', '.join(valid_levels)}"
-            )
-        return level_str
+    def normalize_log_level(cls, v: Any) -> Any:
+        """Accept log levels case-insensitively, the Literal checks membership."""
+        return v.upper().strip() if isinstance(v, str) else v
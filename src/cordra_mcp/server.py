@@ -1,11 +1,19 @@
 """MCP server for Cordra digital object repository."""
 
-import json
+import importlib.util
 import logging
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, cast
 
+import anyio
+import orjson
 from mcp.server.fastmcp import FastMCP
+from pydantic import BaseModel
 
 from . import __version__
+from .cache import InMemoryCacheBackend, StaleWhileRevalidateCache
 from .client import (
     CordraAuthenticationError,
     CordraClient,
@@ -14,17 +22,75 @@ from .client import (
 )
 from .config import CordraConfig
 
-# Initialize the MCP server
 config = CordraConfig()
-mcp = FastMCP("cordra-mcp", host=config.host, port=8000)
 
-# Initialize Cordra client at startup
+# Initialize Cordra client at startup, its connection pool is opened lazily
+# inside the running event loop
 cordra_client = CordraClient(config)
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, CordraClient]]:
+    """Provide the Cordra client to the request handlers.
+
+    The MCP SDK enters the lifespan once per client session. All sessions share
+    one client, so its connection pool is closed by serve() when the server
+    stops rather than when a session ends.
+    """
+    yield {"cordra_client": cordra_client}
+
+
+# Initialize the MCP server
+mcp = FastMCP("cordra-mcp", host=config.host, port=8000, lifespan=lifespan)
+
 logger = logging.getLogger(__name__)
 logger.setLevel(config.log_level)
 
 
+# Responses are sent compact, indentation only helps humans reading them
+_JSON_INDENT = 2 if config.pretty_json else None
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (
+    orjson.OPT_INDENT_2 if config.pretty_json else 0
+)
+
+
+# Serialized type schemas, so repeated reads skip the lookup and the encoding.
+# The client cache below already serves stale schemas while refreshing them,
+# so this layer adds no stale window of its own.
+_schema_json_cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(
+    ttl=config.schema_cache_ttl,
+    backend=InMemoryCacheBackend(max_entries=config.cache_max_entries),
+)
+
+# Serialized list of type names, shared by list_types and the types resource
+_type_list_cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(
+    ttl=config.schema_list_ttl, stale_ttl=config.stale_ttl
+)
+
+
+def _get_cordra_client() -> CordraClient:
+    """Return the Cordra client from the lifespan context of the current request.
+
+    Outside of an MCP request, e.g. when a tool function is called directly, the
+    module-level client is used.
+    """
+    try:
+        lifespan_context = mcp.get_context().request_context.lifespan_context
+    except ValueError:
+        return cordra_client
+    return cast(dict[str, CordraClient], lifespan_context)["cordra_client"]
+
+
+def _to_json(data: Any) -> str:
+    """Serialize data to a JSON string using orjson."""
+    return orjson.dumps(data, option=_JSON_OPTIONS).decode()
+
+
+def _model_to_json(model: BaseModel) -> str:
+    """Serialize a pydantic model to a JSON string."""
+    return model.model_dump_json(indent=_JSON_INDENT)
+
+
 @mcp.tool(
     name="search_objects",
     title="Search Cordra Objects",
@@ -69,15 +135,20 @@ async def search_objects(
         JSON string containing object IDs and pagination info
     """
     try:
-        search_result = await cordra_client.find(
+        search_result = await _get_cordra_client().find(
             query, object_type=type, page_size=limit, page_num=page_num
         )
 
-        # Extract only the IDs from the results
-        search_result["results"] = [obj["id"] for obj in search_result["results"]]
-        # Rename for consistency with documentation
-        search_result["total_count"] = search_result.pop("total_size")
-        return json.dumps(search_result, indent=2)
+        # Extract only the IDs from the results and rename total_size for
+        # consistency with the documentation
+        return _to_json(
+            {
+                "results": [obj["id"] for obj in search_result["results"]],
+                "total_count": search_result["total_size"],
+                "page_num": search_result["page_num"],
+                "page_size": search_result["page_size"],
+            }
+        )
 
     except ValueError as e:
         raise RuntimeError(f"Invalid search parameters: {e}") from e
@@ -118,7 +189,7 @@ async def count_objects(
     """
     try:
         # Use page_size=1 to get minimal data, we only need the total count
-        search_result = await cordra_client.find(
+        search_result = await _get_cordra_client().find(
             query, object_type=type, page_size=1, page_num=0
         )
 
@@ -153,9 +224,8 @@ async def get_object(object_id: str) -> str:
         RuntimeError: If the object is not found or there's an API error
     """
     try:
-        digital_object = await cordra_client.get_object(object_id)
-        object_dict = digital_object.model_dump()
-        return json.dumps(object_dict, indent=2)
+        digital_object = await _get_cordra_client().get_object(object_id)
+        return _model_to_json(digital_object)
 
     except ValueError as e:
         raise RuntimeError(f"Invalid object ID: {e}") from e
@@ -192,9 +262,8 @@ async def get_cordra_design_object() -> str:
         RuntimeError: If the design object is not found, authentication fails, or there's an API error
     """
     try:
-        design_object = await cordra_client.get_design()
-        object_dict = design_object.model_dump()
-        return json.dumps(object_dict, indent=2)
+        design_object = await _get_cordra_client().get_design()
+        return _model_to_json(design_object)
 
     except CordraNotFoundError as e:
         raise RuntimeError("Design object not found") from e
@@ -204,6 +273,29 @@ async def get_cordra_design_object() -> str:
         raise RuntimeError(f"Failed to retrieve design object: {e}") from e
 
 
+async def _list_type_names() -> list[str]:
+    """Page through all schemas, only requesting their names from Cordra."""
+    type_names = []
+    async for schema in _get_cordra_client().find_iter(
+        "type:Schema", fields=["/content/name"]
+    ):
+        try:
+            type_name = schema["content"]["name"]
+        except (KeyError, TypeError):
+            continue
+        # Schemas without a name are skipped
+        if type_name:
+            type_names.append(type_name)
+    return type_names
+
+
+async def _load_type_list_json() -> str:
+    """Fetch the names of all types and serialize them as a sorted list."""
+    type_names = await _list_type_names()
+    type_names.sort()
+    return _to_json(type_names)
+
+
 @mcp.tool(
     name="list_types",
     title="List Available Types",
@@ -221,30 +313,7 @@ async def list_types() -> str:
         RuntimeError: If there's an API error or authentication failure
     """
     try:
-        # Get all available types using pagination
-        all_types = []
-        page_num = 0
-        page_size = 20
-
-        while True:
-            search_result = await cordra_client.find(
-                "type:Schema", page_size=page_size, page_num=page_num
-            )
-            schemas = search_result["results"]
-
-            for schema in schemas:
-                type_name = schema.get("content", {}).get("name")
-                if type_name:
-                    all_types.append(type_name)
-
-            # Check if we've retrieved all schemas
-            if len(schemas) < page_size:
-                break
-
-            page_num += 1
-
-        all_types.sort()
-        return json.dumps(all_types, indent=2)
+        return await _type_list_cache.get("types", lambda _: _load_type_list_json())
 
     except CordraAuthenticationError as e:
         raise RuntimeError(f"Authentication failed: {e}") from e
@@ -252,6 +321,12 @@ async def list_types() -> str:
         raise RuntimeError(f"Failed to list types: {e}") from e
 
 
+async def _load_schema_json(type_name: str) -> str:
+    """Fetch the schema of a type and serialize it."""
+    schema_object = await _get_cordra_client().get_schema(type_name)
+    return _model_to_json(schema_object)
+
+
 @mcp.tool(
     name="get_type_schema",
     title="Get Type Schema",
@@ -275,9 +350,9 @@ async def get_type_schema(type_name: str) -> str:
         RuntimeError: If the type is not found, authentication fails, or there's an API error
     """
     try:
-        schema_object = await cordra_client.get_schema(type_name)
-        schema_dict = schema_object.model_dump()
-        return json.dumps(schema_dict, indent=2)
+        return await _schema_json_cache.get(
+            type_name, lambda _: _load_schema_json(type_name)
+        )
     except CordraNotFoundError as e:
         raise RuntimeError(f"Type '{type_name}' not found") from e
     except CordraAuthenticationError as e:
@@ -288,13 +363,109 @@ async def get_type_schema(type_name: str) -> str:
         ) from e
 
 
+@mcp.resource(
+    "cordra://schemas/{type_name}",
+    name="cordra-type-schema",
+    title="Cordra Type Schema",
+    description="JSON schema definition of a Cordra type, addressed by its name",
+    mime_type="application/json",
+)
+async def get_type_schema_resource(type_name: str) -> str:
+    """Serve the schema of a single type through one templated resource.
+
+    A single URI template covers every type, so no schema has to be fetched or
+    registered while the server starts. The schema is only requested from Cordra
+    once a client actually reads the resource.
+
+    Args:
+        type_name: The name of the type to retrieve the schema for
+
+    Returns:
+        JSON string containing the schema definition
+
+    Raises:
+        RuntimeError: If the type is not found, authentication fails, or there's an API error
+    """
+    schema_json: str = await get_type_schema(type_name)
+    return schema_json
+
+
+@mcp.resource(
+    "cordra://schemas",
+    name="cordra-types",
+    title="Cordra Types",
+    description="JSON array with the names of all types defined in the Cordra repository",
+    mime_type="application/json",
+)
+async def get_types_resource() -> str:
+    """Serve the sorted names of all types.
+
+    The list is fetched when the resource is read and cached for
+    schema_list_ttl seconds. Each schema is then available under
+    cordra://schemas/{type_name}.
+
+    Returns:
+        JSON string containing a list of type names
+
+    Raises:
+        RuntimeError: If there's an API error or authentication failure
+    """
+    types_json: str = await list_types()
+    return types_json
+
+
+async def prewarm_schema_cache() -> None:
+    """Load the schemas of all types into the cache.
+
+    All schemas are fetched with a few bulk searches instead of one lookup per
+    type and cached page by page. Failures are logged and otherwise ignored,
+    the remaining schemas are then loaded on first use instead.
+    """
+    with anyio.move_on_after(config.timeout) as scope:
+        type_names = []
+        try:
+            async for schema in _get_cordra_client().iter_all_schemas():
+                type_name = schema.content.get("name")
+                if type_name:
+                    type_names.append(type_name)
+                    await _schema_json_cache.set(type_name, _model_to_json(schema))
+        except CordraClientError as e:
+            logger.warning("Failed to prewarm the schema cache: %s", e)
+            return
+
+        await _type_list_cache.set("types", _to_json(sorted(type_names)))
+        logger.info("Prewarmed %d type schemas", len(type_names))
+
+    if scope.cancelled_caught:
+        logger.warning("Prewarming the schema cache timed out")
+
+
+async def serve() -> None:
+    """Run the MCP server and close the Cordra connection pool on shutdown."""
+    try:
+        async with anyio.create_task_group() as task_group:
+            # Prewarming runs next to the server and never delays startup
+            if config.prewarm_schemas:
+                task_group.start_soon(prewarm_schema_cache)
+
+            if config.run_mode == "stdio":
+                await mcp.run_stdio_async()
+            else:
+                await mcp.run_streamable_http_async()
+
+            task_group.cancel_scope.cancel()
+    finally:
+        await cordra_client.aclose()
+
+
 def main() -> None:
     """Main entry point for the MCP server."""
-    logger.info(f"Starting Cordra MCP server v{__version__}...")
-    if config.run_mode == "stdio":
-        mcp.run()
-    else:
-        mcp.run(transport="streamable-http")
+    logger.info("Starting Cordra MCP server v%s...", __version__)
+    # uvloop is optional (installed with the "production" extra)
+    use_uvloop = (
+        sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None
+    )
+    anyio.run(serve, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+"""Unit tests for the async batcher."""
+
+import asyncio
+from collections.abc import Mapping, Sequence
+
+import pytest
+
+from cordra_mcp.batch import AsyncBatcher
+
+
+class RecordingBatcher(AsyncBatcher[str, str]):
+    """Batcher upper-casing items and recording each batch."""
+
+    def __init__(self, max_batch_size: int = 50, max_queue_time: float = 0.005) -> None:
+        super().__init__(max_batch_size=max_batch_size, max_queue_time=max_queue_time)
+        self.batches: list[list[str]] = []
+
+    async def process_batch(self, items: Sequence[str]) -> Mapping[str, str | Exception]:
+        self.batches.append(list(items))
+        return {
+            item: ValueError(item) if item == "bad" else item.upper()
+            for item in items
+            if item != "missing"
+        }
+
+
+class TestAsyncBatcher:
+    """Test the AsyncBatcher class."""
+
+    async def test_concurrent_items_are_batched(self) -> None:
+        """Test that items queued within the window are processed together."""
+        batcher = RecordingBatcher()
+
+        results = await asyncio.gather(
+            batcher.process("a"), batcher.process("b"), batcher.process("a")
+        )
+
+        assert list(results) == ["A", "B", "A"]
+        assert batcher.batches == [["a", "b"]]
+
+    async def test_max_batch_size_flushes_early(self) -> None:
+        """Test that reaching max_batch_size processes the batch immediately."""
+        batcher = RecordingBatcher(max_batch_size=2, max_queue_time=10)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.process("a"), batcher.process("b")), timeout=1
+        )
+
+        assert list(results) == ["A", "B"]
+
+    async def test_per_item_exceptions(self) -> None:
+        """Test that per-item exceptions and missing items only affect their callers."""
+        batcher = RecordingBatcher()
+
+        results = await asyncio.gather(
+            batcher.process("a"),
+            batcher.process("bad"),
+            batcher.process("missing"),
+            return_exceptions=True,
+        )
+
+        assert results[0] == "A"
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[2], KeyError)
+
+    async def test_batch_failure_propagates(self) -> None:
+        """Test that a failing batch raises for every caller."""
+
+        class FailingBatcher(AsyncBatcher[str, str]):
+            async def process_batch(self, items: Sequence[str]) -> Mapping[str, str | Exception]:
+                raise RuntimeError("upstream down")
+
+        batcher = FailingBatcher()
+
+        with pytest.raises(RuntimeError):
+            await batcher.process("a")
+
+    async def test_cancelled_batch_cancels_callers(self) -> None:
+        """Test that callers are not left waiting when the batch task is cancelled."""
+
+        class SlowBatcher(AsyncBatcher[str, str]):
+            async def process_batch(self, items: Sequence[str]) -> Mapping[str, str | Exception]:
+                await asyncio.sleep(1)
+                return {}
+
+        batcher = SlowBatcher(max_batch_size=1)
+        caller = asyncio.create_task(batcher.process("a"))
+        await asyncio.sleep(0)
+        for task in batcher._tasks:
+            task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(caller, timeout=1)
+
+    def test_process_batch_must_be_implemented(self) -> None:
+        """Test that a batcher without process_batch cannot be created."""
+        with pytest.raises(TypeError, match="abstract"):
+            AsyncBatcher()  # type: ignore[abstract]
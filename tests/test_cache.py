@@ -0,0 +1,211 @@
+"""Unit tests for the caching helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from cordra_mcp.cache import (
+    CacheEntry,
+    InMemoryCacheBackend,
+    SingleFlight,
+    StaleWhileRevalidateCache,
+)
+
+
+class TestSingleFlight:
+    """Test the SingleFlight class."""
+
+    async def test_concurrent_calls_share_result(self) -> None:
+        """Test that concurrent calls for one key run the function once."""
+        flight: SingleFlight[str] = SingleFlight()
+        calls = 0
+
+        async def fn() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(flight.do("key", fn) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert calls == 1
+
+    async def test_concurrent_calls_share_exception(self) -> None:
+        """Test that an exception is raised to every waiting caller."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def fn() -> str:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(
+            *(flight.do("key", fn) for _ in range(3)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_sequential_calls_are_not_shared(self) -> None:
+        """Test that a finished call is not reused by later callers."""
+        flight: SingleFlight[int] = SingleFlight()
+        fn = AsyncMock(side_effect=[1, 2])
+
+        assert await flight.do("key", fn) == 1
+        assert await flight.do("key", fn) == 2
+
+    async def test_cancelled_caller_does_not_cancel_waiters(self) -> None:
+        """Test that cancelling the first caller keeps the call for the others."""
+        flight: SingleFlight[str] = SingleFlight()
+
+        async def fn() -> str:
+            await asyncio.sleep(0.01)
+            return "value"
+
+        first = asyncio.create_task(flight.do("key", fn))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flight.do("key", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "value"
+        assert first.cancelled()
+
+    async def test_call_cancelled_when_all_callers_cancelled(self) -> None:
+        """Test that the call is cancelled once nobody waits for it."""
+        flight: SingleFlight[str] = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def fn() -> str:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "value"
+
+        caller = asyncio.create_task(flight.do("key", fn))
+        await asyncio.sleep(0)
+        caller.cancel()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert await flight.do("key", AsyncMock(return_value="new")) == "new"
+
+
+class TestInMemoryCacheBackend:
+    """Test the InMemoryCacheBackend class."""
+
+    async def test_evicts_least_recently_used(self) -> None:
+        """Test that the least recently used entry is evicted first."""
+        backend: InMemoryCacheBackend[str] = InMemoryCacheBackend(max_entries=2)
+        await backend.set("a", CacheEntry(value="a", stored_at=0.0))
+        await backend.set("b", CacheEntry(value="b", stored_at=0.0))
+        await backend.get("a")
+        await backend.set("c", CacheEntry(value="c", stored_at=0.0))
+
+        assert len(backend) == 2
+        assert await backend.get("b") is None
+        assert await backend.get("a") is not None
+        assert await backend.get("c") is not None
+
+
+class TestStaleWhileRevalidateCache:
+    """Test the StaleWhileRevalidateCache class."""
+
+    async def test_miss_calls_loader(self) -> None:
+        """Test that a miss loads and stores the value."""
+        cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(ttl=60)
+        loader = AsyncMock(return_value="value")
+
+        assert await cache.get("key", loader) == "value"
+        assert await cache.get("key", loader) == "value"
+
+        loader.assert_called_once_with(None)
+        assert cache.stats == {"hits": 1, "stale_hits": 0, "misses": 1}
+
+    async def test_disabled_cache_always_loads(self) -> None:
+        """Test that a ttl of 0 bypasses the cache."""
+        cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(ttl=0)
+        loader = AsyncMock(return_value="value")
+
+        await cache.get("key", loader)
+        await cache.get("key", loader)
+
+        assert loader.call_count == 2
+
+    async def test_stale_entry_served_and_refreshed(self) -> None:
+        """Test that a stale entry is returned while refreshing in the background."""
+        backend: InMemoryCacheBackend[str] = InMemoryCacheBackend()
+        cache = StaleWhileRevalidateCache(ttl=10, stale_ttl=100, backend=backend)
+        await backend.set("key", CacheEntry(value="old", stored_at=0.0))
+        loader = AsyncMock(return_value="new")
+
+        with patch("cordra_mcp.cache.time.time", return_value=50.0):
+            assert await cache.get("key", loader) == "old"
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        loader.assert_called_once_with("old")
+        entry = await backend.get("key")
+        assert entry is not None and entry.value == "new"
+        assert cache.stats["stale_hits"] == 1
+
+    async def test_stale_entry_kept_on_refresh_failure(self) -> None:
+        """Test that a failing background refresh keeps serving the stale entry."""
+        backend: InMemoryCacheBackend[str] = InMemoryCacheBackend()
+        cache = StaleWhileRevalidateCache(ttl=10, stale_ttl=100, backend=backend)
+        await backend.set("key", CacheEntry(value="old", stored_at=0.0))
+        loader = AsyncMock(side_effect=RuntimeError("upstream down"))
+
+        with patch("cordra_mcp.cache.time.time", return_value=50.0):
+            assert await cache.get("key", loader) == "old"
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert await cache.get("key", loader) == "old"
+
+    async def test_stale_entry_evicted_on_evict_on_error(self) -> None:
+        """Test that a refresh raising an evict_on exception removes the entry."""
+        backend: InMemoryCacheBackend[str] = InMemoryCacheBackend()
+        cache = StaleWhileRevalidateCache(
+            ttl=10, stale_ttl=100, backend=backend, evict_on=(LookupError,)
+        )
+        await backend.set("key", CacheEntry(value="old", stored_at=0.0))
+        loader = AsyncMock(side_effect=LookupError("deleted"))
+
+        with patch("cordra_mcp.cache.time.time", return_value=50.0):
+            assert await cache.get("key", loader) == "old"
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+        assert await backend.get("key") is None
+
+    async def test_expired_entry_is_a_miss(self) -> None:
+        """Test that entries past the stale window are reloaded."""
+        backend: InMemoryCacheBackend[str] = InMemoryCacheBackend()
+        cache = StaleWhileRevalidateCache(ttl=10, stale_ttl=10, backend=backend)
+        await backend.set("key", CacheEntry(value="old", stored_at=0.0))
+        loader = AsyncMock(side_effect=RuntimeError("upstream down"))
+
+        with (
+            patch("cordra_mcp.cache.time.time", return_value=50.0),
+            pytest.raises(RuntimeError),
+        ):
+            await cache.get("key", loader)
+
+        loader.assert_called_once_with("old")
+
+    async def test_concurrent_misses_load_once(self) -> None:
+        """Test that concurrent misses for one key call the loader only once."""
+        cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(ttl=60)
+        calls = 0
+
+        async def loader(previous: str | None) -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get("key", loader) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert calls == 1
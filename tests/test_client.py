@@ -1,9 +1,12 @@
 """Unit tests for the Cordra client."""
 
+import asyncio
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+from pydantic import ValidationError
 
 from cordra_mcp.client import (
     CordraAuthenticationError,
@@ -101,6 +104,13 @@ class TestDigitalObject:
         assert obj.acl is None
         assert obj.payloads is None
 
+    def test_digital_object_is_frozen(self) -> None:
+        """Test that fields of a DigitalObject cannot be reassigned."""
+        obj = DigitalObject(id="test/123", type="TestType", content={"title": "Test"})
+
+        with pytest.raises(ValidationError, match="frozen"):
+            obj.type = "Other"
+
 
 class TestCordraClient:
     """Test the CordraClient class."""
@@ -109,14 +119,31 @@ class TestCordraClient:
         """Test client initialization."""
         client = CordraClient(config)
         assert client.config == config
-
-    @patch("cordra_mcp.client.requests.Session.get")
+        assert client.client.base_url == "https://test.example.com"
+        assert isinstance(client.client.auth, httpx.BasicAuth)
+
+    def test_http_client_created_lazily(self, client: CordraClient) -> None:
+        """Test that the HTTP client is only created on first use and then reused."""
+        assert client._client is None
+        http_client = client.client
+        assert client.client is http_client
+
+    async def test_aclose(self, client: CordraClient) -> None:
+        """Test that aclose closes the underlying HTTP client."""
+        http_client = client.client
+        await client.aclose()
+        assert http_client.is_closed
+        assert client._client is None
+
+    async def test_aclose_without_client(self, client: CordraClient) -> None:
+        """Test that aclose is a no-op if no request was ever made."""
+        await client.aclose()
+        assert client._client is None
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_get_object_success(self, mock_get: Any, client: CordraClient, mock_cordra_object: dict[str, Any]) -> None:
         """Test successful object retrieval."""
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_cordra_object
-        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = httpx.Response(200, json=mock_cordra_object)
 
         result = await client.get_object("test/123")
 
@@ -132,36 +159,236 @@ class TestCordraClient:
         assert result.payloads and len(result.payloads) == 2
 
         mock_get.assert_called_once_with(
-            "https://test.example.com/objects/test/123",
+            "/objects/test/123",
+            params={"full": "true"},
+        )
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_untrusted_upstream_validates(self, mock_get: Any, config: CordraConfig) -> None:
+        """Test that responses are validated when trust_upstream is disabled."""
+        config.trust_upstream = False
+        client = CordraClient(config)
+        mock_get.return_value = httpx.Response(
+            200, json={"type": "TestType", "content": {}, "payloads": "invalid"}
+        )
+
+        with pytest.raises(ValidationError):
+            await client.get_object("test/123")
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_cached(self, mock_get: Any, client: CordraClient, mock_cordra_object: dict[str, Any]) -> None:
+        """Test that repeated reads of the same object are served from the cache."""
+        mock_get.return_value = httpx.Response(200, json=mock_cordra_object)
+
+        first = await client.get_object("test/123")
+        second = await client.get_object("test/123")
+
+        assert first == second
+        mock_get.assert_called_once()
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_revalidated_with_etag(self, mock_get: Any, config: CordraConfig, mock_cordra_object: dict[str, Any]) -> None:
+        """Test that an expired object is revalidated with If-None-Match."""
+        config.stale_ttl = 0
+        client = CordraClient(config)
+        mock_get.side_effect = [
+            httpx.Response(200, json=mock_cordra_object, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        ]
+
+        with patch("cordra_mcp.cache.time.time") as mock_time:
+            mock_time.return_value = 0.0
+            first = await client.get_object("test/123")
+            mock_time.return_value = 100.0
+            second = await client.get_object("test/123")
+
+        assert second is first
+        mock_get.assert_called_with(
+            "/objects/test/123",
+            params={"full": "true"},
+            headers={"If-None-Match": '"v1"'},
+        )
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_deleted_object_not_served_stale(self, mock_get: Any, client: CordraClient, mock_cordra_object: dict[str, Any]) -> None:
+        """Test that a 404 during a background refresh drops the stale object."""
+        mock_get.side_effect = [
+            httpx.Response(200, json=mock_cordra_object),
+            httpx.Response(404),
+        ]
+
+        with patch("cordra_mcp.cache.time.time") as mock_time:
+            mock_time.return_value = 0.0
+            await client.get_object("test/123")
+            mock_time.return_value = 100.0
+            await client.get_object("test/123")
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            with pytest.raises(CordraNotFoundError):
+                await client.get_object("test/123")
+
+        assert mock_get.call_count == 2
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_revalidated_with_last_modified(self, mock_get: Any, config: CordraConfig, mock_cordra_object: dict[str, Any]) -> None:
+        """Test that Last-Modified is used when Cordra sends no ETag."""
+        config.stale_ttl = 0
+        client = CordraClient(config)
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        changed = {**mock_cordra_object, "content": {"name": "Changed"}}
+        mock_get.side_effect = [
+            httpx.Response(
+                200, json=mock_cordra_object, headers={"Last-Modified": last_modified}
+            ),
+            httpx.Response(200, json=changed),
+        ]
+
+        with patch("cordra_mcp.cache.time.time") as mock_time:
+            mock_time.return_value = 0.0
+            await client.get_object("test/123")
+            mock_time.return_value = 100.0
+            result = await client.get_object("test/123")
+
+        assert result.content == {"name": "Changed"}
+        mock_get.assert_called_with(
+            "/objects/test/123",
             params={"full": "true"},
-            timeout=30,
+            headers={"If-Modified-Since": last_modified},
+        )
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_cache_disabled(self, mock_get: Any, config: CordraConfig, mock_cordra_object: dict[str, Any]) -> None:
+        """Test that a cache_ttl of 0 disables caching."""
+        config.cache_ttl = 0
+        client = CordraClient(config)
+        mock_get.return_value = httpx.Response(200, json=mock_cordra_object)
+
+        await client.get_object("test/123")
+        await client.get_object("test/123")
+
+        assert mock_get.call_count == 2
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_batched(self, mock_get: Any, config: CordraConfig, mock_cordra_object: dict[str, Any]) -> None:
+        """Test that concurrent reads are resolved with a single search when batching is enabled."""
+        config.batch_window = 0.005
+        client = CordraClient(config)
+        mock_get.return_value = httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"id": "test/1", **mock_cordra_object},
+                    {"id": "test/2", **mock_cordra_object},
+                ],
+                "size": 2,
+                "pageNum": 0,
+                "pageSize": 2,
+            },
+        )
+
+        first, second = await asyncio.gather(
+            client.get_object("test/1"), client.get_object("test/2")
+        )
+
+        assert first.id == "test/1"
+        assert second.id == "test/2"
+        mock_get.assert_called_once_with(
+            "/search",
+            params={
+                "query": 'id:("test/1" OR "test/2")',
+                "pageSize": "2",
+                "pageNum": "0",
+                "full": "true",
+            },
+        )
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_batched_missing_falls_back(self, mock_get: Any, config: CordraConfig, mock_cordra_object: dict[str, Any]) -> None:
+        """Test that IDs missing from the batched search are fetched individually."""
+        config.batch_window = 0.005
+        client = CordraClient(config)
+        mock_get.side_effect = [
+            httpx.Response(
+                200,
+                json={
+                    "results": [{"id": "test/1", **mock_cordra_object}],
+                    "size": 1,
+                    "pageNum": 0,
+                    "pageSize": 2,
+                },
+            ),
+            httpx.Response(404),
+        ]
+
+        results = await asyncio.gather(
+            client.get_object("test/1"),
+            client.get_object("test/missing"),
+            return_exceptions=True,
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+        assert isinstance(results[0], DigitalObject)
+        assert isinstance(results[1], CordraNotFoundError)
+        assert mock_get.call_count == 2
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_get_object_not_found(self, mock_get: Any, client: CordraClient) -> None:
         """Test object not found exception."""
-        mock_response = mock_get.return_value
-        mock_response.status_code = 404
-        mock_response.ok = False
+        mock_get.return_value = httpx.Response(404)
 
-        with pytest.raises(CordraNotFoundError) as exc_info:
+        with pytest.raises(CordraNotFoundError, match="Resource not found"):
             await client.get_object("test/nonexistent")
 
-        assert "Resource not found" in str(exc_info.value)
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_not_found_remembered(self, mock_get: Any, client: CordraClient) -> None:
+        """Test that repeated reads of a missing object do not hit Cordra again."""
+        mock_get.return_value = httpx.Response(404)
+
+        for _ in range(2):
+            with pytest.raises(CordraNotFoundError):
+                await client.get_object("nonexistent/123")
+
+        mock_get.assert_called_once()
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_not_found_expires(self, mock_get: Any, client: CordraClient, mock_cordra_object: dict[str, Any]) -> None:
+        """Test that a remembered 404 expires after not_found_ttl."""
+        mock_get.side_effect = [
+            httpx.Response(404),
+            httpx.Response(200, json=mock_cordra_object),
+        ]
+
+        with patch("cordra_mcp.client.time.monotonic") as mock_time:
+            mock_time.return_value = 0.0
+            with pytest.raises(CordraNotFoundError):
+                await client.get_object("test/123")
+            mock_time.return_value = 31.0
+            result = await client.get_object("test/123")
 
-    @patch("cordra_mcp.client.requests.Session.get")
+        assert result.id == "test/123"
+        assert mock_get.call_count == 2
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_get_object_general_error(self, mock_get: Any, client: CordraClient) -> None:
         """Test general error handling."""
-        from requests import RequestException
-
-        mock_get.side_effect = RequestException("Connection failed")
+        mock_get.side_effect = httpx.ConnectError("Connection failed")
 
-        with pytest.raises(CordraClientError) as exc_info:
+        with pytest.raises(
+            CordraClientError, match="Failed to retrieve object test/123"
+        ):
             await client.get_object("test/123")
 
-        assert "Failed to retrieve object test/123" in str(exc_info.value)
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_object_invalid_json(self, mock_get: Any, client: CordraClient) -> None:
+        """Test that an unparsable response body raises a client error."""
+        mock_get.return_value = httpx.Response(200, content=b"<html>")
+
+        with pytest.raises(
+            CordraClientError, match="Failed to retrieve object test/123"
+        ):
+            await client.get_object("test/123")
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_find_success(self, mock_get: Any, client: CordraClient) -> None:
         """Test successful find operation."""
         mock_response_data = {
@@ -174,10 +401,7 @@ class TestCordraClient:
             "pageNum": 0,
             "pageSize": 20,
         }
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = httpx.Response(200, json=mock_response_data)
 
         result = await client.find("type:Schema")
 
@@ -191,19 +415,34 @@ class TestCordraClient:
         assert result["page_size"] == 20
 
         mock_get.assert_called_once_with(
-            "https://test.example.com/search",
+            "/search",
             params={"query": "type:Schema", "pageSize": "20", "pageNum": "0"},
-            timeout=30,
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_find_concurrent_identical_queries(self, mock_get: Any, client: CordraClient) -> None:
+        """Test that concurrent identical searches share one request."""
+        mock_response_data = {"results": [], "size": 0, "pageNum": 0, "pageSize": 20}
+
+        async def slow_get(*args: Any, **kwargs: Any) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=mock_response_data)
+
+        mock_get.side_effect = slow_get
+
+        results = await asyncio.gather(
+            client.find("type:Schema"), client.find("type:Schema")
+        )
+
+        assert results[0] == results[1]
+        assert results[0] is not results[1]
+        mock_get.assert_called_once()
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_find_empty_results(self, mock_get: Any, client: CordraClient) -> None:
         """Test find with empty results."""
         mock_response_data = {"results": [], "size": 0, "pageNum": 0, "pageSize": 20}
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = httpx.Response(200, json=mock_response_data)
 
         result = await client.find("type:NonExistent")
 
@@ -213,100 +452,77 @@ class TestCordraClient:
         assert result["page_num"] == 0
         assert result["page_size"] == 20
         mock_get.assert_called_once_with(
-            "https://test.example.com/search",
+            "/search",
             params={"query": "type:NonExistent", "pageSize": "20", "pageNum": "0"},
-            timeout=30,
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_find_error(self, mock_get: Any, client: CordraClient) -> None:
         """Test find error handling."""
-        from requests import RequestException
-
-        mock_get.side_effect = RequestException("Search failed")
+        mock_get.side_effect = httpx.ConnectError("Search failed")
 
-        with pytest.raises(CordraClientError) as exc_info:
+        with pytest.raises(
+            CordraClientError, match="Failed to search with query 'invalid:query'.*Search failed"
+        ):
             await client.find("invalid:query")
 
-        assert "Failed to search with query 'invalid:query'" in str(exc_info.value)
-        assert "Search failed" in str(exc_info.value)
-
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_find_with_type_filter(self, mock_get: Any, client: CordraClient) -> None:
         """Test find operation with type filter constructs correct query."""
         mock_response_data = {"results": [], "size": 0, "pageNum": 0, "pageSize": 20}
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        mock_response.ok = True
+        mock_get.return_value = httpx.Response(200, json=mock_response_data)
 
         await client.find("name:John", object_type="Person")
 
         mock_get.assert_called_once_with(
-            "https://test.example.com/search",
+            "/search",
             params={"query": "type:Person AND (name:John)", "pageSize": "20", "pageNum": "0"},
-            timeout=30,
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_find_with_page_size(self, mock_get: Any, client: CordraClient) -> None:
         """Test find operation with custom page size."""
         mock_response_data = {"results": [], "size": 0, "pageNum": 0, "pageSize": 50}
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        mock_response.ok = True
+        mock_get.return_value = httpx.Response(200, json=mock_response_data)
 
         await client.find("type:Test", page_size=50)
 
         mock_get.assert_called_once_with(
-            "https://test.example.com/search",
+            "/search",
             params={"query": "type:Test", "pageSize": "50", "pageNum": "0"},
-            timeout=30,
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_find_with_type_and_page_size(self, mock_get: Any, client: CordraClient) -> None:
         """Test find operation with both type filter and page size."""
         mock_response_data = {"results": [], "size": 0, "pageNum": 0, "pageSize": 25}
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        mock_response.ok = True
+        mock_get.return_value = httpx.Response(200, json=mock_response_data)
 
         await client.find("title:Report", object_type="Document", page_size=25)
 
         mock_get.assert_called_once_with(
-            "https://test.example.com/search",
+            "/search",
             params={"query": "type:Document AND (title:Report)", "pageSize": "25", "pageNum": "0"},
-            timeout=30,
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_find_default_params(self, mock_get: Any, client: CordraClient) -> None:
         """Test find operation with default parameters."""
         mock_response_data = {"results": [], "size": 0, "pageNum": 0, "pageSize": 20}
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        mock_response.ok = True
+        mock_get.return_value = httpx.Response(200, json=mock_response_data)
 
         await client.find("content:test")
 
         mock_get.assert_called_once_with(
-            "https://test.example.com/search",
+            "/search",
             params={"query": "content:test", "pageSize": "20", "pageNum": "0"},
-            timeout=30,
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_find_with_page_num(self, mock_get: Any, client: CordraClient) -> None:
         """Test find operation with specific page number."""
         mock_response_data = {"results": [], "size": 100, "pageNum": 2, "pageSize": 20}
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        mock_response.ok = True
+        mock_get.return_value = httpx.Response(200, json=mock_response_data)
 
         result = await client.find("type:Schema", page_num=2)
 
@@ -314,19 +530,15 @@ class TestCordraClient:
         assert result["page_size"] == 20
         assert result["total_size"] == 100
         mock_get.assert_called_once_with(
-            "https://test.example.com/search",
+            "/search",
             params={"query": "type:Schema", "pageSize": "20", "pageNum": "2"},
-            timeout=30,
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_find_with_custom_page_size_and_num(self, mock_get: Any, client: CordraClient) -> None:
         """Test find operation with custom page size and page number."""
         mock_response_data = {"results": [], "size": 500, "pageNum": 5, "pageSize": 10}
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_response_data
-        mock_response.ok = True
+        mock_get.return_value = httpx.Response(200, json=mock_response_data)
 
         result = await client.find("type:Document", page_size=10, page_num=5)
 
@@ -334,12 +546,132 @@ class TestCordraClient:
         assert result["page_size"] == 10
         assert result["total_size"] == 500
         mock_get.assert_called_once_with(
-            "https://test.example.com/search",
+            "/search",
             params={"query": "type:Document", "pageSize": "10", "pageNum": "5"},
-            timeout=30,
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_find_with_fields(self, mock_get: Any, client: CordraClient) -> None:
+        """Test that fields are passed to Cordra as a filter."""
+        mock_get.return_value = httpx.Response(
+            200, json={"results": [], "size": 0, "pageNum": 0, "pageSize": 20}
+        )
+
+        await client.find("type:Schema", fields=["/content/name"])
+
+        mock_get.assert_called_once_with(
+            "/search",
+            params={
+                "query": "type:Schema",
+                "pageSize": "20",
+                "pageNum": "0",
+                "filter": '["/content/name"]',
+            },
+        )
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_find_iter_pages(self, mock_get: Any, client: CordraClient) -> None:
+        """Test that find_iter requests pages until a short page is returned."""
+        mock_get.side_effect = [
+            httpx.Response(
+                200,
+                json={
+                    "results": [{"id": "a"}, {"id": "b"}],
+                    "size": 3,
+                    "pageNum": 0,
+                    "pageSize": 2,
+                },
+            ),
+            httpx.Response(
+                200,
+                json={"results": [{"id": "c"}], "size": 3, "pageNum": 1, "pageSize": 2},
+            ),
+        ]
+
+        results = [obj async for obj in client.find_iter("type:Schema", page_size=2)]
+
+        assert [obj["id"] for obj in results] == ["a", "b", "c"]
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["params"]["pageNum"] == "1"
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_schema_success(self, mock_get: Any, client: CordraClient) -> None:
+        """Test resolving a schema by name and fetching the schema object."""
+        schema = {"id": "test/schema", "type": "Schema", "content": {"name": "Person"}}
+        mock_get.side_effect = [
+            httpx.Response(200, json={"results": [schema], "size": 1, "pageNum": 0, "pageSize": 20}),
+            httpx.Response(200, json=schema),
+        ]
+
+        result = await client.get_schema("Person")
+
+        assert result.id == "test/schema"
+        assert result.content == {"name": "Person"}
+        mock_get.assert_called_with("/objects/test/schema", params={"full": "true"})
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_schema_revalidated_with_its_own_etag(self, mock_get: Any, config: CordraConfig) -> None:
+        """Test that a newer ETag seen via get_object does not validate an old schema copy."""
+        config.stale_ttl = 0
+        client = CordraClient(config)
+        v1 = {"id": "test/schema", "type": "Schema", "content": {"name": "Person", "v": 1}}
+        v2 = {"id": "test/schema", "type": "Schema", "content": {"name": "Person", "v": 2}}
+        search = {"results": [v1], "size": 1, "pageNum": 0, "pageSize": 20}
+        mock_get.side_effect = [
+            httpx.Response(200, json=search),
+            httpx.Response(200, json=v1, headers={"ETag": '"v1"'}),
+            httpx.Response(200, json=v2, headers={"ETag": '"v2"'}),
+            httpx.Response(200, json=search),
+            httpx.Response(200, json=v2, headers={"ETag": '"v2"'}),
+        ]
+
+        with patch("cordra_mcp.cache.time.time") as mock_time:
+            mock_time.return_value = 0.0
+            await client.get_schema("Person")
+            obj = await client.get_object("test/schema")
+            mock_time.return_value = 100.0
+            schema = await client.get_schema("Person")
+
+        assert obj.content["v"] == 2
+        assert schema.content["v"] == 2
+        mock_get.assert_called_with(
+            "/objects/test/schema",
+            params={"full": "true"},
+            headers={"If-None-Match": '"v1"'},
+        )
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_iter_all_schemas_seeds_cache(self, mock_get: Any, client: CordraClient) -> None:
+        """Test that bulk loaded schemas are served from the schema cache."""
+        schema = {"id": "test/schema", "type": "Schema", "content": {"name": "Person"}}
+        mock_get.return_value = httpx.Response(
+            200, json={"results": [schema], "size": 1, "pageNum": 0, "pageSize": 500}
+        )
+
+        schemas = [schema async for schema in client.iter_all_schemas()]
+        cached = await client.get_schema("Person")
+
+        assert [s.id for s in schemas] == ["test/schema"]
+        assert cached.id == "test/schema"
+        mock_get.assert_called_once_with(
+            "/search",
+            params={
+                "query": "type:Schema",
+                "pageSize": "500",
+                "pageNum": "0",
+                "full": "true",
+            },
+        )
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
+    async def test_get_schema_not_found(self, mock_get: Any, client: CordraClient) -> None:
+        """Test that an unknown schema name raises CordraNotFoundError."""
+        mock_get.return_value = httpx.Response(200, json={"results": [], "size": 0, "pageNum": 0, "pageSize": 20})
+
+        with pytest.raises(CordraNotFoundError, match="Schema 'Unknown' not found"):
+            await client.get_schema("Unknown")
+
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_get_design_success(self, mock_get: Any, client: CordraClient) -> None:
         """Test successful design object retrieval."""
         mock_design_data = {
@@ -351,10 +683,7 @@ class TestCordraClient:
             },
             "metadata": {"created": "2023-01-01", "modified": "2023-06-15"}
         }
-        mock_response = mock_get.return_value
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_design_data
-        mock_response.ok = True
+        mock_get.return_value = httpx.Response(200, json=mock_design_data)
 
         result = await client.get_design()
 
@@ -364,46 +693,33 @@ class TestCordraClient:
         assert result.content["systemConfig"]["serverName"] == "test-cordra"
 
         mock_get.assert_called_once_with(
-            "https://test.example.com/api/objects/design",
-            timeout=30,
+            "/api/objects/design",
         )
 
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_get_design_authentication_error(self, mock_get: Any, client: CordraClient) -> None:
         """Test design object retrieval with authentication error."""
-        mock_response = mock_get.return_value
-        mock_response.status_code = 403
-        mock_response.ok = False
+        mock_get.return_value = httpx.Response(403)
 
-        with pytest.raises(CordraAuthenticationError) as exc_info:
+        with pytest.raises(CordraAuthenticationError, match="Authentication failed"):
             await client.get_design()
 
-        assert "Authentication failed" in str(exc_info.value)
-
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_get_design_not_found(self, mock_get: Any, client: CordraClient) -> None:
         """Test design object retrieval with not found error."""
-        mock_response = mock_get.return_value
-        mock_response.status_code = 404
-        mock_response.ok = False
+        mock_get.return_value = httpx.Response(404)
 
-        with pytest.raises(CordraNotFoundError) as exc_info:
+        with pytest.raises(CordraNotFoundError, match="Resource not found"):
             await client.get_design()
 
-        assert "Resource not found" in str(exc_info.value)
-
-    @patch("cordra_mcp.client.requests.Session.get")
+    @patch("cordra_mcp.client.httpx.AsyncClient.get", new_callable=AsyncMock)
     async def test_get_design_request_error(self, mock_get: Any, client: CordraClient) -> None:
         """Test design object retrieval with request error."""
-        from requests import RequestException
+        mock_get.side_effect = httpx.ConnectError("Connection failed")
 
-        mock_get.side_effect = RequestException("Connection failed")
-
-        with pytest.raises(CordraClientError) as exc_info:
+        with pytest.raises(CordraClientError, match="Failed to retrieve design object"):
             await client.get_design()
 
-        assert "Failed to retrieve design object" in str(exc_info.value)
-
 
 class TestCordraConfig:
     """Test the CordraConfig class."""
@@ -416,3 +732,30 @@ class TestCordraConfig:
         assert config.password is None
         assert config.verify_ssl is True
         assert config.timeout == 30
+        assert config.cache_ttl == 60
+        assert config.stale_ttl == 300
+        assert config.schema_cache_ttl == 300
+        assert config.schema_list_ttl == 60
+        assert config.cache_max_entries == 1024
+        assert config.not_found_ttl == 30
+        assert config.prewarm_schemas is False
+        assert config.trust_upstream is True
+        assert config.batch_window == 0
+        assert config.pretty_json is False
+
+    def test_log_level_case_insensitive(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the log level is accepted in any case."""
+        monkeypatch.setenv("LOGLEVEL", " debug ")
+        assert CordraConfig().log_level == "DEBUG"
+
+    def test_invalid_log_level(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that unknown log levels are rejected."""
+        monkeypatch.setenv("LOGLEVEL", "verbose")
+        with pytest.raises(ValidationError):
+            CordraConfig()
+
+    @pytest.mark.parametrize("max_entries", [0, -1])
+    def test_cache_max_entries_must_be_positive(self, max_entries: int) -> None:
+        """Test that cache sizes that would disable caching are rejected."""
+        with pytest.raises(ValidationError):
+            CordraConfig(cache_max_entries=max_entries)
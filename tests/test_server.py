@@ -1,11 +1,17 @@
 """Unit tests for the MCP server."""
 
-import json
+import asyncio
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
+from cordra_mcp import server
+from cordra_mcp.cache import StaleWhileRevalidateCache
 from cordra_mcp.client import (
     CordraAuthenticationError,
     CordraClientError,
@@ -17,25 +23,58 @@ from cordra_mcp.server import (
     get_cordra_design_object,
     get_object,
     get_type_schema,
+    get_type_schema_resource,
+    lifespan,
     list_types,
+    main,
+    mcp,
+    prewarm_schema_cache,
     search_objects,
+    serve,
 )
 
 
 @pytest.fixture
-def sample_digital_object() -> DigitalObject:
-    """Create a sample DigitalObject for testing."""
-    return DigitalObject(
-        id="people/john-doe-123",
-        type="Person",
-        content={
+def mock_client(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replace the module-level Cordra client with a bare stub.
+
+    Tests assign the client methods they need, e.g. as AsyncMock.
+    """
+    client = SimpleNamespace()
+    monkeypatch.setattr("cordra_mcp.server.cordra_client", client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def schema_json_cache() -> Iterator[StaleWhileRevalidateCache[str]]:
+    """Give every test an empty schema cache."""
+    cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(ttl=300)
+    with patch("cordra_mcp.server._schema_json_cache", cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def type_list_cache() -> Iterator[StaleWhileRevalidateCache[str]]:
+    """Give every test an empty type list cache."""
+    cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(ttl=60)
+    with patch("cordra_mcp.server._type_list_cache", cache):
+        yield cache
+
+
+@pytest.fixture(scope="session")
+def sample_object_data() -> dict[str, Any]:
+    """The JSON representation of the sample object, shared by all tests."""
+    return {
+        "id": "people/john-doe-123",
+        "type": "Person",
+        "content": {
             "name": "John Doe",
             "birthday": "1990-05-15",
             "email": "john.doe@example.com",
         },
-        metadata={"created": "2023-01-01", "modified": "2023-06-15"},
-        acl={"read": ["public"], "write": ["admin"]},
-        payloads=[
+        "metadata": {"created": "2023-01-01", "modified": "2023-06-15"},
+        "acl": {"read": ["public"], "write": ["admin"]},
+        "payloads": [
             {
                 "name": "profile_photo",
                 "filename": "john_doe_profile.jpg",
@@ -43,199 +82,166 @@ def sample_digital_object() -> DigitalObject:
                 "mediaType": "image/jpeg",
             }
         ],
-    )
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_digital_object(sample_object_data: dict[str, Any]) -> DigitalObject:
+    """Create a sample DigitalObject shared by all tests, which must not mutate it."""
+    return DigitalObject.model_validate(sample_object_data)
 
 
 class TestGetObject:
     """Test the get_object tool."""
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_object_success(
-        self, mock_client: Any, sample_digital_object: DigitalObject
+        self,
+        mock_client: Any,
+        sample_digital_object: DigitalObject,
+        sample_object_data: dict[str, Any],
     ) -> None:
         """Test successful object retrieval with complete ID."""
         mock_client.get_object = AsyncMock(return_value=sample_digital_object)
 
         result = await get_object("people/john-doe-123")
 
-        # Verify the result is valid JSON
-        parsed_result = json.loads(result)
-        assert parsed_result["id"] == "people/john-doe-123"
-        assert parsed_result["type"] == "Person"
-        assert parsed_result["content"]["name"] == "John Doe"
+        # Verify the complete object is returned as compact JSON
+        assert orjson.loads(result) == sample_object_data
+        assert "\n" not in result
 
         # Verify the client was called with the correct object ID
         mock_client.get_object.assert_called_once_with("people/john-doe-123")
 
-    @patch("cordra_mcp.server.cordra_client")
-    async def test_get_object_not_found(self, mock_client: Any) -> None:
-        """Test object not found exception."""
-        mock_client.get_object = AsyncMock(
-            side_effect=CordraNotFoundError("Object not found: test/nonexistent")
-        )
+    @pytest.mark.parametrize(
+        ("object_id", "error", "expected_message"),
+        [
+            (
+                "test/nonexistent",
+                CordraNotFoundError("Object not found: test/nonexistent"),
+                "Object not found: test/nonexistent",
+            ),
+            (
+                "test/obj123",
+                CordraClientError("Connection failed"),
+                "Failed to retrieve object test/obj123",
+            ),
+            (
+                "test/obj123",
+                CordraAuthenticationError("Authentication failed"),
+                "Authentication failed",
+            ),
+        ],
+        ids=["not_found", "client_error", "authentication_error"],
+    )
+    async def test_get_object_error(
+        self, mock_client: Any, object_id: str, error: Exception, expected_message: str
+    ) -> None:
+        """Test that client errors are mapped to RuntimeError messages."""
+        mock_client.get_object = AsyncMock(side_effect=error)
 
-        with pytest.raises(RuntimeError) as exc_info:
-            await get_object("test/nonexistent")
+        with pytest.raises(RuntimeError, match=re.escape(expected_message)):
+            await get_object(object_id)
 
-        assert "Object not found: test/nonexistent" in str(exc_info.value)
-        mock_client.get_object.assert_called_once_with("test/nonexistent")
+        mock_client.get_object.assert_called_once_with(object_id)
 
-    @patch("cordra_mcp.server.cordra_client")
-    async def test_get_object_client_error(self, mock_client: Any) -> None:
-        """Test general client error handling."""
-        mock_client.get_object = AsyncMock(
-            side_effect=CordraClientError("Connection failed")
-        )
 
-        with pytest.raises(RuntimeError) as exc_info:
-            await get_object("test/obj123")
+def returning(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Create a coroutine function stub returning value, without call tracking."""
 
-        assert "Failed to retrieve object test/obj123" in str(exc_info.value)
-        mock_client.get_object.assert_called_once_with("test/obj123")
+    async def stub(*args: Any, **kwargs: Any) -> Any:
+        return value
 
-    @patch("cordra_mcp.server.cordra_client")
-    async def test_get_object_authentication_error(self, mock_client: Any) -> None:
-        """Test authentication error handling."""
-        mock_client.get_object = AsyncMock(
-            side_effect=CordraAuthenticationError("Authentication failed")
-        )
+    return stub
+
+
+def raising(error: Exception) -> Callable[..., Awaitable[Any]]:
+    """Create a coroutine function stub raising error, without call tracking."""
+
+    async def stub(*args: Any, **kwargs: Any) -> Any:
+        raise error
+
+    return stub
+
+
+def async_iter_mock(items: Sequence[Any]) -> MagicMock:
+    """Create a mock for an async generator method yielding the given items."""
 
-        with pytest.raises(RuntimeError) as exc_info:
-            await get_object("test/obj123")
+    async def iterate(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        for item in items:
+            yield item
 
-        assert "Authentication failed" in str(exc_info.value)
-        mock_client.get_object.assert_called_once_with("test/obj123")
+    return MagicMock(side_effect=iterate)
 
 
 class TestListTypes:
     """Test the list_types tool."""
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_list_types_success(self, mock_client: Any) -> None:
         """Test successful listing of available types."""
-        mock_search_result = {
-            "results": [
-                {"content": {"name": "User"}, "id": "test/user-schema"},
-                {"content": {"name": "Project"}, "id": "test/project-schema"},
-                {"content": {"name": "Document"}, "id": "test/doc-schema"},
-            ],
-            "total_size": 3,
-            "page_num": 0,
-            "page_size": 20,
-        }
-        mock_client.find = AsyncMock(return_value=mock_search_result)
+        mock_client.find_iter = async_iter_mock(
+            [
+                {"content": {"name": "User"}},
+                {"content": {"name": "Project"}},
+                {"content": {"name": "Document"}},
+            ]
+        )
 
         result = await list_types()
 
         # Verify the result is valid JSON
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result == ["Document", "Project", "User"]  # Should be sorted
 
-        # Verify the client was called with correct query
-        mock_client.find.assert_called_once_with(
-            "type:Schema", page_size=20, page_num=0
+        # Verify only the names were requested
+        mock_client.find_iter.assert_called_once_with(
+            "type:Schema", fields=["/content/name"]
         )
 
-    @patch("cordra_mcp.server.cordra_client")
-    async def test_list_types_with_pagination(self, mock_client: Any) -> None:
-        """Test listing types with pagination."""
-        first_page = {
-            "results": [
-                {"content": {"name": f"Type{i}"}, "id": f"test/schema{i}"}
-                for i in range(20)
-            ],
-            "total_size": 25,
-            "page_num": 0,
-            "page_size": 20,
-        }
-
-        second_page = {
-            "results": [
-                {"content": {"name": "ZType"}, "id": "test/zschema"},
-            ],
-            "total_size": 25,
-            "page_num": 1,
-            "page_size": 20,
-        }
-
-        mock_client.find = AsyncMock(side_effect=[first_page, second_page])
-
-        result = await list_types()
-
-        parsed_result = json.loads(result)
-        # Should contain all 21 types and be sorted
-        assert len(parsed_result) == 21
-        assert parsed_result == sorted(parsed_result)
-        assert "Type0" in parsed_result
-        assert "ZType" in parsed_result
-
-        # Verify pagination calls
-        assert mock_client.find.call_count == 2
-
-    @patch("cordra_mcp.server.cordra_client")
     async def test_list_types_missing_name(self, mock_client: Any) -> None:
         """Test listing types when some schemas have missing name field."""
-        mock_search_result = {
-            "results": [
-                {"content": {"name": "User"}, "id": "test/user-schema"},
-                {"content": {}, "id": "test/no-name-schema"},  # Missing name
-                {"content": {"name": "Project"}, "id": "test/project-schema"},
-            ],
-            "total_size": 3,
-            "page_num": 0,
-            "page_size": 20,
-        }
-        mock_client.find = AsyncMock(return_value=mock_search_result)
+        mock_client.find_iter = async_iter_mock(
+            [
+                {"content": {"name": "User"}},
+                {"content": {}},  # Missing name
+                {"content": {"name": "Project"}},
+            ]
+        )
 
         result = await list_types()
 
         # Only 2 types should be returned (those with name)
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result == ["Project", "User"]
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_list_types_client_error(self, mock_client: Any) -> None:
         """Test listing types with client error."""
-        mock_client.find = AsyncMock(side_effect=CordraClientError("Search failed"))
+        mock_client.find_iter = MagicMock(side_effect=CordraClientError("Search failed"))
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Failed to list types:"):
             await list_types()
 
-        assert "Failed to list types:" in str(exc_info.value)
-
-    @patch("cordra_mcp.server.cordra_client")
     async def test_list_types_authentication_error(self, mock_client: Any) -> None:
         """Test listing types with authentication error."""
-        mock_client.find = AsyncMock(
+        mock_client.find_iter = MagicMock(
             side_effect=CordraAuthenticationError("Authentication failed")
         )
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Authentication failed:"):
             await list_types()
 
-        assert "Authentication failed:" in str(exc_info.value)
-
-    @patch("cordra_mcp.server.cordra_client")
     async def test_list_types_empty(self, mock_client: Any) -> None:
         """Test listing types when no types are available."""
-        mock_search_result = {
-            "results": [],
-            "total_size": 0,
-            "page_num": 0,
-            "page_size": 20,
-        }
-        mock_client.find = AsyncMock(return_value=mock_search_result)
+        mock_client.find_iter = async_iter_mock([])
 
         result = await list_types()
 
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result == []
 
 
 class TestGetTypeSchema:
     """Test the get_type_schema tool."""
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_type_schema_success(self, mock_client: Any) -> None:
         """Test successful schema retrieval."""
         mock_schema = DigitalObject(
@@ -248,7 +254,7 @@ class TestGetTypeSchema:
         result = await get_type_schema("User")
 
         # Verify the result is valid JSON
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result["id"] == "test/user-schema"
         assert parsed_result["type"] == "Schema"
         assert parsed_result["content"]["name"] == "User"
@@ -256,44 +262,37 @@ class TestGetTypeSchema:
         # Verify the client was called with correct schema name
         mock_client.get_schema.assert_called_once_with("User")
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_type_schema_not_found(self, mock_client: Any) -> None:
         """Test schema retrieval with type not found."""
         mock_client.get_schema = AsyncMock(
             side_effect=CordraNotFoundError("Schema not found")
         )
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Type 'NonExistent' not found"):
             await get_type_schema("NonExistent")
 
-        assert "Type 'NonExistent' not found" in str(exc_info.value)
         mock_client.get_schema.assert_called_once_with("NonExistent")
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_type_schema_authentication_error(self, mock_client: Any) -> None:
         """Test schema retrieval with authentication error."""
-        mock_client.get_schema = AsyncMock(
-            side_effect=CordraAuthenticationError("Authentication failed")
+        mock_client.get_schema = raising(
+            CordraAuthenticationError("Authentication failed")
         )
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Authentication failed:"):
             await get_type_schema("User")
 
-        assert "Authentication failed:" in str(exc_info.value)
-
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_type_schema_client_error(self, mock_client: Any) -> None:
         """Test schema retrieval with client error."""
-        mock_client.get_schema = AsyncMock(
-            side_effect=CordraClientError("Connection failed")
+        mock_client.get_schema = raising(
+            CordraClientError("Connection failed")
         )
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(
+            RuntimeError, match="Failed to retrieve schema for type 'User':"
+        ):
             await get_type_schema("User")
 
-        assert "Failed to retrieve schema for type 'User':" in str(exc_info.value)
-
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_type_schema_json_formatting(self, mock_client: Any) -> None:
         """Test that schema is properly formatted as JSON."""
         mock_schema = DigitalObject(
@@ -301,20 +300,95 @@ class TestGetTypeSchema:
             type="Schema",
             content={"name": "Test", "properties": {"field": "value"}},
         )
-        mock_client.get_schema = AsyncMock(return_value=mock_schema)
+        mock_client.get_schema = returning(mock_schema)
 
         result = await get_type_schema("Test")
 
-        # Verify it's valid JSON with proper indentation
-        parsed_result = json.loads(result)
+        # Verify it's valid, compact JSON
+        parsed_result = orjson.loads(result)
         assert isinstance(parsed_result, dict)
+        assert "\n" not in result
+
+    async def test_get_type_schema_cached(self, mock_client: Any) -> None:
+        """Test that the serialized schema is reused for repeated reads."""
+        mock_schema = DigitalObject(id="test/schema", type="Schema", content={"name": "Test"})
+        mock_client.get_schema = AsyncMock(return_value=mock_schema)
+
+        first = await get_type_schema("Test")
+        second = await get_type_schema("Test")
+
+        assert first == second
+        mock_client.get_schema.assert_called_once_with("Test")
+
+    @patch("cordra_mcp.server._JSON_INDENT", 2)
+    async def test_get_type_schema_pretty_json(self, mock_client: Any) -> None:
+        """Test that the schema is indented when pretty_json is enabled."""
+        mock_schema = DigitalObject(id="test/schema", type="Schema", content={"name": "Test"})
+        mock_client.get_schema = returning(mock_schema)
+
+        result = await get_type_schema("Test")
+
         assert "  " in result  # Should have 2-space indentation
 
 
+class TestTypeSchemaResource:
+    """Test the templated cordra://schemas/{type_name} resource."""
+
+    async def test_schema_resource_is_single_template(self) -> None:
+        """Test that schemas are exposed through one template, not per-type resources."""
+        templates = await mcp.list_resource_templates()
+        resources = await mcp.list_resources()
+
+        assert [t.uriTemplate for t in templates] == ["cordra://schemas/{type_name}"]
+        assert templates[0].name == "cordra-type-schema"
+        assert templates[0].description
+        assert "{" not in templates[0].description
+        assert [str(r.uri) for r in resources] == ["cordra://schemas"]
+
+    async def test_types_resource_lists_names(self, mock_client: Any) -> None:
+        """Test that cordra://schemas lists the type names and caches them."""
+        mock_client.find_iter = async_iter_mock(
+            [{"content": {"name": "User"}}, {"content": {"name": "Project"}}]
+        )
+
+        first = list(await mcp.read_resource("cordra://schemas"))
+        second = list(await mcp.read_resource("cordra://schemas"))
+
+        assert first[0].mime_type == "application/json"
+        assert orjson.loads(first[0].content) == ["Project", "User"]
+        assert second[0].content == first[0].content
+        mock_client.find_iter.assert_called_once()
+
+    async def test_schema_resource_fetches_on_read(self, mock_client: Any) -> None:
+        """Test that the schema is only fetched when the resource is read."""
+        mock_schema = DigitalObject(
+            id="test/user-schema",
+            type="Schema",
+            content={"name": "User", "type": "object", "properties": {}},
+        )
+        mock_client.get_schema = AsyncMock(return_value=mock_schema)
+
+        contents = list(await mcp.read_resource("cordra://schemas/User"))
+
+        assert len(contents) == 1
+        assert contents[0].mime_type == "application/json"
+        parsed_result = orjson.loads(contents[0].content)
+        assert parsed_result["content"]["name"] == "User"
+        mock_client.get_schema.assert_called_once_with("User")
+
+    async def test_schema_resource_not_found(self, mock_client: Any) -> None:
+        """Test schema resource with type not found."""
+        mock_client.get_schema = raising(
+            CordraNotFoundError("Schema not found")
+        )
+
+        with pytest.raises(RuntimeError, match="Type 'NonExistent' not found"):
+            await get_type_schema_resource("NonExistent")
+
+
 class TestSearchObjects:
     """Test the search_objects tool."""
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_success(self, mock_client: Any) -> None:
         """Test successful object search."""
         mock_search_result = {
@@ -339,7 +413,7 @@ class TestSearchObjects:
         result = await search_objects("name:John")
 
         # Verify the result is valid JSON
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result["results"] == ["people/john-doe", "people/jane-smith"]
         assert parsed_result["total_count"] == 2
         assert parsed_result["page_num"] == 0
@@ -350,7 +424,6 @@ class TestSearchObjects:
             "name:John", object_type=None, page_size=25, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_with_type_filter(self, mock_client: Any) -> None:
         """Test object search with type filter."""
         mock_search_result = {
@@ -370,7 +443,7 @@ class TestSearchObjects:
         result = await search_objects("name:John", type="Person")
 
         # Verify the result is valid JSON
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result["results"] == ["people/john-doe"]
         assert parsed_result["total_count"] == 1
 
@@ -379,7 +452,6 @@ class TestSearchObjects:
             "name:John", object_type="Person", page_size=25, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_with_limit(self, mock_client: Any) -> None:
         """Test object search with custom limit."""
         mock_search_result = {
@@ -399,7 +471,7 @@ class TestSearchObjects:
         result = await search_objects("name:John", limit=50)
 
         # Verify the result is valid JSON with new format
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result["results"] == ["people/john-doe"]
         assert parsed_result["page_size"] == 50
 
@@ -408,7 +480,6 @@ class TestSearchObjects:
             "name:John", object_type=None, page_size=50, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_with_all_parameters(self, mock_client: Any) -> None:
         """Test object search with all parameters."""
         mock_search_result = {
@@ -428,7 +499,7 @@ class TestSearchObjects:
         result = await search_objects("title:Report", type="Document", limit=25)
 
         # Verify the result is valid JSON
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result["results"] == ["documents/report-123"]
         assert parsed_result["total_count"] == 1
 
@@ -437,7 +508,6 @@ class TestSearchObjects:
             "title:Report", object_type="Document", page_size=25, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_empty_results(self, mock_client: Any) -> None:
         """Test object search with no results."""
         mock_search_result = {
@@ -451,7 +521,7 @@ class TestSearchObjects:
         result = await search_objects("nonexistent:data")
 
         # Verify the result is valid JSON with empty array
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result["results"] == []
         assert parsed_result["total_count"] == 0
 
@@ -459,7 +529,6 @@ class TestSearchObjects:
             "nonexistent:data", object_type=None, page_size=25, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_with_slash_prefixed_properties(
         self, mock_client: Any
     ) -> None:
@@ -481,7 +550,7 @@ class TestSearchObjects:
         # Test with slash-prefixed property and nested property
         result = await search_objects("/title:*report* AND /author/name:Daniel")
 
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result["results"] == ["reports/2024-annual"]
         assert parsed_result["total_count"] == 1
 
@@ -492,33 +561,28 @@ class TestSearchObjects:
             page_num=0,
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_client_error(self, mock_client: Any) -> None:
         """Test object search with client error."""
         mock_client.find = AsyncMock(side_effect=CordraClientError("Search failed"))
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Search failed:"):
             await search_objects("test:query")
 
-        assert "Search failed:" in str(exc_info.value)
         mock_client.find.assert_called_once_with(
             "test:query", object_type=None, page_size=25, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_value_error(self, mock_client: Any) -> None:
         """Test object search with value error."""
         mock_client.find = AsyncMock(side_effect=ValueError("Invalid query"))
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Invalid search parameters:"):
             await search_objects("invalid:query")
 
-        assert "Invalid search parameters:" in str(exc_info.value)
         mock_client.find.assert_called_once_with(
             "invalid:query", object_type=None, page_size=25, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_json_formatting(self, mock_client: Any) -> None:
         """Test that search results are properly formatted as JSON."""
         mock_search_result = {
@@ -529,22 +593,21 @@ class TestSearchObjects:
             "page_num": 0,
             "page_size": 1000,
         }
-        mock_client.find = AsyncMock(return_value=mock_search_result)
+        mock_client.find = returning(mock_search_result)
 
         result = await search_objects("test:query")
 
-        # Verify it's valid JSON with proper indentation
-        parsed_result = json.loads(result)
+        # Verify it's valid JSON
+        parsed_result = orjson.loads(result)
         assert isinstance(parsed_result, dict)
 
-        # Check that the result contains indentation (pretty-printed)
-        assert "  " in result  # Should have 2-space indentation
+        # Check that the result is compact
+        assert "\n" not in result
 
         # Verify the content is correctly formatted
         assert parsed_result["results"] == ["test/object"]
         assert parsed_result["total_count"] == 1
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_with_page_num(self, mock_client: Any) -> None:
         """Test object search with page number parameter."""
         mock_search_result = {
@@ -568,7 +631,6 @@ class TestSearchObjects:
             "type:Document", object_type=None, page_size=25, page_num=1
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_search_objects_with_all_pagination_params(
         self, mock_client: Any
     ) -> None:
@@ -598,7 +660,6 @@ class TestSearchObjects:
 class TestGetCordraDesign:
     """Test the get_cordra_design_object tool."""
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_design_success(self, mock_client: Any) -> None:
         """Test successful design object retrieval."""
         mock_design = DigitalObject(
@@ -616,57 +677,50 @@ class TestGetCordraDesign:
         result = await get_cordra_design_object()
 
         # Verify the result is valid JSON
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
         assert parsed_result["id"] == "design"
         assert parsed_result["type"] == "CordraDesign"
         assert parsed_result["content"]["systemConfig"]["serverName"] == "test-cordra"
-        assert "types" in parsed_result["content"]
-        assert "workflows" in parsed_result["content"]
+        assert {"types", "workflows"} <= parsed_result["content"].keys()
 
         # Verify the client was called
         mock_client.get_design.assert_called_once()
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_design_not_found(self, mock_client: Any) -> None:
         """Test design object not found exception."""
         mock_client.get_design = AsyncMock(
             side_effect=CordraNotFoundError("Design object not found")
         )
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Design object not found"):
             await get_cordra_design_object()
 
-        assert "Design object not found" in str(exc_info.value)
         mock_client.get_design.assert_called_once()
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_design_authentication_error(self, mock_client: Any) -> None:
         """Test design object authentication error."""
         mock_client.get_design = AsyncMock(
             side_effect=CordraAuthenticationError("Authentication failed")
         )
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Authentication failed"):
             await get_cordra_design_object()
 
-        assert "Authentication failed" in str(exc_info.value)
         mock_client.get_design.assert_called_once()
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_design_client_error(self, mock_client: Any) -> None:
         """Test design object general client error."""
         mock_client.get_design = AsyncMock(
             side_effect=CordraClientError("Connection failed")
         )
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(
+            RuntimeError, match="Failed to retrieve design object.*Connection failed"
+        ):
             await get_cordra_design_object()
 
-        assert "Failed to retrieve design object" in str(exc_info.value)
-        assert "Connection failed" in str(exc_info.value)
         mock_client.get_design.assert_called_once()
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_get_design_json_formatting(self, mock_client: Any) -> None:
         """Test that the design object is properly formatted as JSON."""
         mock_design = DigitalObject(
@@ -675,28 +729,24 @@ class TestGetCordraDesign:
             content={"data": "value"},
             metadata={"created": "2023-01-01"},
         )
-        mock_client.get_design = AsyncMock(return_value=mock_design)
+        mock_client.get_design = returning(mock_design)
 
         result = await get_cordra_design_object()
 
-        # Verify it's valid JSON with proper indentation
-        parsed_result = json.loads(result)
+        # Verify it's valid JSON
+        parsed_result = orjson.loads(result)
         assert isinstance(parsed_result, dict)
 
-        # Check that the result contains indentation (pretty-printed)
-        assert "  " in result  # Should have 2-space indentation
+        # Check that the result is compact
+        assert "\n" not in result
 
         # Verify all expected fields are present
-        assert "id" in parsed_result
-        assert "type" in parsed_result
-        assert "content" in parsed_result
-        assert "metadata" in parsed_result
+        assert {"id", "type", "content", "metadata"} <= parsed_result.keys()
 
 
 class TestCountObjects:
     """Test the count_objects tool."""
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_count_objects_success(self, mock_client: Any) -> None:
         """Test successful object count."""
         mock_search_result = {
@@ -717,7 +767,6 @@ class TestCountObjects:
             "name:John", object_type=None, page_size=1, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_count_objects_with_type_filter(self, mock_client: Any) -> None:
         """Test object count with type filter."""
         mock_search_result = {
@@ -738,7 +787,6 @@ class TestCountObjects:
             "name:John", object_type="Person", page_size=1, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_count_objects_zero_results(self, mock_client: Any) -> None:
         """Test object count with zero results."""
         mock_search_result = {
@@ -758,43 +806,159 @@ class TestCountObjects:
             "nonexistent:data", object_type=None, page_size=1, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_count_objects_client_error(self, mock_client: Any) -> None:
         """Test object count with client error."""
         mock_client.find = AsyncMock(side_effect=CordraClientError("Search failed"))
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Count failed:"):
             await count_objects("test:query")
 
-        assert "Count failed:" in str(exc_info.value)
         mock_client.find.assert_called_once_with(
             "test:query", object_type=None, page_size=1, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_count_objects_value_error(self, mock_client: Any) -> None:
         """Test object count with value error."""
         mock_client.find = AsyncMock(side_effect=ValueError("Invalid query"))
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Invalid search parameters:"):
             await count_objects("invalid:query")
 
-        assert "Invalid search parameters:" in str(exc_info.value)
         mock_client.find.assert_called_once_with(
             "invalid:query", object_type=None, page_size=1, page_num=0
         )
 
-    @patch("cordra_mcp.server.cordra_client")
     async def test_count_objects_authentication_error(self, mock_client: Any) -> None:
         """Test object count with authentication error."""
         mock_client.find = AsyncMock(
             side_effect=CordraAuthenticationError("Authentication failed")
         )
 
-        with pytest.raises(RuntimeError) as exc_info:
+        with pytest.raises(RuntimeError, match="Authentication failed:"):
             await count_objects("test:query")
 
-        assert "Authentication failed:" in str(exc_info.value)
         mock_client.find.assert_called_once_with(
             "test:query", object_type=None, page_size=1, page_num=0
         )
+
+
+class TestLifespan:
+    """Test passing the Cordra client through the lifespan context."""
+
+    async def test_lifespan_provides_shared_client(self) -> None:
+        """Test that every session receives the module-level client."""
+        async with lifespan(mcp) as first, lifespan(mcp) as second:
+            assert first["cordra_client"] is server.cordra_client
+            assert second["cordra_client"] is server.cordra_client
+
+    async def test_handler_uses_lifespan_client(
+        self,
+        mock_client: Any,
+        sample_digital_object: DigitalObject,
+        sample_object_data: dict[str, Any],
+    ) -> None:
+        """Test that handlers prefer the client from the request context."""
+        mock_client.get_object = AsyncMock()
+        injected = AsyncMock()
+        injected.get_object.return_value = sample_digital_object
+        context = SimpleNamespace(
+            request_context=SimpleNamespace(lifespan_context={"cordra_client": injected})
+        )
+
+        with patch.object(mcp, "get_context", return_value=context):
+            result = await get_object("people/john-doe-123")
+
+        assert orjson.loads(result) == sample_object_data
+        injected.get_object.assert_called_once_with("people/john-doe-123")
+        mock_client.get_object.assert_not_called()
+
+
+class TestPrewarmSchemaCache:
+    """Test prewarming the schema cache."""
+
+    async def test_prewarm_seeds_schema_cache(self, mock_client: Any) -> None:
+        """Test that bulk loaded schemas are served without further lookups."""
+        mock_client.iter_all_schemas = async_iter_mock(
+            [
+                DigitalObject(id="test/user", type="Schema", content={"name": "User"}),
+                DigitalObject(id="test/unnamed", type="Schema", content={}),
+            ]
+        )
+        mock_client.get_schema = AsyncMock()
+        mock_client.find_iter = MagicMock()
+
+        await prewarm_schema_cache()
+        result = await get_type_schema("User")
+        types = await list_types()
+
+        assert orjson.loads(result)["id"] == "test/user"
+        assert orjson.loads(types) == ["User"]
+        mock_client.get_schema.assert_not_called()
+        mock_client.find_iter.assert_not_called()
+
+    async def test_prewarm_error_is_ignored(self, mock_client: Any) -> None:
+        """Test that a failing bulk load is logged and ignored."""
+        mock_client.iter_all_schemas = MagicMock(
+            side_effect=CordraClientError("Search failed")
+        )
+
+        await prewarm_schema_cache()
+
+    async def test_prewarm_keeps_schemas_loaded_before_error(
+        self, mock_client: Any
+    ) -> None:
+        """Test that schemas from pages received before a failure stay cached."""
+
+        async def iterate() -> AsyncIterator[DigitalObject]:
+            yield DigitalObject(id="test/user", type="Schema", content={"name": "User"})
+            raise CordraClientError("Search failed")
+
+        mock_client.iter_all_schemas = iterate
+        mock_client.get_schema = AsyncMock()
+
+        await prewarm_schema_cache()
+        result = await get_type_schema("User")
+
+        assert orjson.loads(result)["id"] == "test/user"
+        mock_client.get_schema.assert_not_called()
+
+
+class TestServe:
+    """Test running the server."""
+
+    async def test_serve_cancels_prewarm_on_exit(self, mock_client: Any) -> None:
+        """Test that a running prewarm is cancelled and the pool closed on exit."""
+        prewarm_cancelled = False
+
+        async def slow_prewarm() -> None:
+            nonlocal prewarm_cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                prewarm_cancelled = True
+                raise
+
+        mock_client.aclose = AsyncMock()
+        with (
+            patch.object(server.config, "prewarm_schemas", True),
+            patch.object(server.config, "run_mode", "stdio"),
+            patch("cordra_mcp.server.prewarm_schema_cache", slow_prewarm),
+            patch.object(mcp, "run_stdio_async", AsyncMock()),
+        ):
+            await serve()
+
+        assert prewarm_cancelled
+        mock_client.aclose.assert_called_once()
+
+
+class TestMain:
+    """Test the server entry point."""
+
+    @patch("cordra_mcp.server.anyio.run")
+    @patch("cordra_mcp.server.importlib.util.find_spec", return_value=None)
+    def test_main_without_uvloop(self, mock_find_spec: Any, mock_run: Any) -> None:
+        """Test that the default event loop is used if uvloop is not installed."""
+        main()
+
+        mock_find_spec.assert_called_with("uvloop")
+        mock_run.assert_called_once_with(serve, backend_options={"use_uvloop": False})